@@ -23,8 +23,11 @@ import copy
 import hashlib
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Literal
 
+from django.db.models import Max
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import SystemMessage
 from langgraph.graph import END, StateGraph
@@ -41,7 +44,7 @@ from apps.workspaces.models import SchemaState, TenantSchema
 from mcp_server.context import load_tenant_context
 from mcp_server.pipeline_registry import get_registry
 from mcp_server.services.metadata import (
-    pipeline_describe_table,
+    pipeline_describe_tables,
     pipeline_list_tables,
     transformation_aware_list_tables,
 )
@@ -91,6 +94,57 @@ def _system_prompt_cache_key(workspace, user) -> str:
     return f"{workspace.id}:{user_id}:{prompt_hash}"
 
 
+# Rendered schema context, keyed by schema + materialization fingerprint. Outlives the
+# system prompt cache because the key changes whenever the table list is re-materialized.
+# Insertion-ordered so the oldest entries are evicted first once the cap is reached.
+_schema_context_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_SCHEMA_CONTEXT_TTL = 600  # 10 minutes — bounds staleness from out-of-band DDL
+_SCHEMA_CONTEXT_MAX_ENTRIES = 256
+
+
+def _schema_context_cache_key(
+    tenant_schema,
+    user,
+    tables: list[dict],
+    has_lineage: bool,
+    tenant_metadata=None,
+    transformed_at=None,
+) -> str:
+    """Build a cache key from the inputs that determine the rendered schema context.
+
+    An entry is invalidated by:
+    - a change in any listed table's name, description, row count or materialized_at
+      (a new materialization, or a transformation asset added, removed or re-described);
+    - a save of the user's TenantMetadata, which holds the column annotations;
+    - a newer TransformationRun for the tenant, which rebuilds the terminal models
+      (they are listed with materialized_at None, so the table fingerprint misses it).
+    """
+    fingerprint = "|".join(
+        f"{t['name']}@{t.get('materialized_at')}:{t.get('row_count')}:{t.get('description')}"
+        for t in tables
+    )
+    tables_hash = hashlib.md5(fingerprint.encode()).hexdigest()[:12]
+    user_id = getattr(user, "id", "anon")
+    metadata_version = tenant_metadata.updated_at.isoformat() if tenant_metadata else "none"
+    transform_version = transformed_at.isoformat() if transformed_at else "none"
+    return (
+        f"{tenant_schema.id}:{user_id}:{tables_hash}:{int(has_lineage)}"
+        f":{metadata_version}:{transform_version}"
+    )
+
+
+# Appended to the schema block when tables come from a transformation pipeline
+_LINEAGE_HINT = (
+    "These tables are produced by a transformation pipeline. "
+    "Use the `get_lineage` tool to explore how any table was built."
+)
+
+
+def _format_row_count(table: dict) -> str:
+    """Format a table's row count for the schema block."""
+    return f"{table['row_count']:,}" if table.get("row_count") is not None else "unknown"
+
+
 def _render_compact_schema(tables: list[dict], last_materialized_at: str | None) -> str:
     """Render a compact schema block: table names, descriptions, row counts."""
     lines = []
@@ -102,46 +156,63 @@ def _render_compact_schema(tables: list[dict], last_materialized_at: str | None)
     lines.append("### Available Tables\n")
     lines.append("| Table | Description | Rows |")
     lines.append("|---|---|---|")
-    for t in tables:
-        row_count = f"{t['row_count']:,}" if t.get("row_count") is not None else "unknown"
-        desc = t.get("description") or ""
-        lines.append(f"| {t['name']} | {desc} | {row_count} |")
+    lines.extend(
+        f"| {t['name']} | {t.get('description') or ''} | {_format_row_count(t)} |" for t in tables
+    )
 
     lines.append("\nUse the `describe_table` tool for column details.")
     return "\n".join(lines)
 
 
-def _render_full_schema(
+def _iter_full_schema(
     tables: list[dict],
     column_map: dict[str, list[dict]],
     last_materialized_at: str | None,
-) -> str:
-    """Render a full schema block with column details per table."""
-    lines = []
+) -> Iterator[str]:
+    """Yield the lines of the full schema block one table at a time."""
     if last_materialized_at:
-        lines.append(f"Data is loaded and ready. Last updated: {last_materialized_at}\n")
+        yield f"Data is loaded and ready. Last updated: {last_materialized_at}\n"
     else:
-        lines.append("Data is loaded and ready.\n")
+        yield "Data is loaded and ready.\n"
 
-    lines.append("### Available Tables\n")
+    yield "### Available Tables\n"
     for t in tables:
-        row_count = f"{t['row_count']:,}" if t.get("row_count") is not None else "unknown"
         desc = t.get("description") or ""
-        header = f"**{t['name']}**"
-        if desc:
-            header += f" — {desc}"
-        header += f" ({row_count} rows)"
-        lines.append(header)
+        desc_part = f" — {desc}" if desc else ""
+        yield f"**{t['name']}**{desc_part} ({_format_row_count(t)} rows)"
 
         cols = column_map.get(t["name"], [])
         if cols:
-            lines.append("Columns:")
+            yield "Columns:"
             for col in cols:
                 col_desc = f" — {col['description']}" if col.get("description") else ""
-                lines.append(f"- {col['name']} ({col['type']}){col_desc}")
-        lines.append("")
+                yield f"- {col['name']} ({col['type']}){col_desc}"
+        yield ""
 
-    return "\n".join(lines)
+
+def _render_full_schema(
+    tables: list[dict],
+    column_map: dict[str, list[dict]],
+    last_materialized_at: str | None,
+    char_budget: int | None = None,
+) -> str | None:
+    """Render a full schema block with column details per table.
+
+    With a char_budget, rendering stops and returns None as soon as the block would
+    exceed it, so an oversized schema is never materialized in full.
+    """
+    lines = _iter_full_schema(tables, column_map, last_materialized_at)
+    if char_budget is None:
+        return "\n".join(lines)
+
+    kept = []
+    size = -1  # no separator before the first line
+    for line in lines:
+        size += len(line) + 1
+        if size > char_budget:
+            return None
+        kept.append(line)
+    return "\n".join(kept)
 
 
 async def _fetch_schema_context(tenant, user) -> str:
@@ -188,47 +259,86 @@ async def _fetch_schema_context(tenant, user) -> str:
 
     last_materialized_at = tables[0].get("materialized_at") if tables else None
 
-    # Try full schema with columns
-    try:
-        ctx = await load_tenant_context(tenant.external_id)
-        from apps.workspaces.models import TenantMetadata
+    # Column annotations live on the user's TenantMetadata and terminal models are rebuilt
+    # by TransformationRuns, so both are part of the cache key
+    from apps.transformations.models import TransformationRun
+    from apps.workspaces.models import TenantMetadata
 
+    tenant_metadata = None
+    transformed_at = None
+    cacheable = True
+    try:
         tenant_metadata = await TenantMetadata.objects.filter(
             tenant_membership__tenant=tenant, tenant_membership__user=user
         ).afirst()
+        if terminal_assets:
+            latest_run = await TransformationRun.objects.filter(tenant=tenant).aaggregate(
+                latest=Max("completed_at")
+            )
+            transformed_at = latest_run["latest"]
+    except Exception:
+        logger.debug("Could not load schema context cache key inputs", exc_info=True)
+        cacheable = False
 
-        column_map: dict[str, list[dict]] = {}
-        for t in tables:
-            detail = await pipeline_describe_table(t["name"], ctx, tenant_metadata, pipeline_config)
-            if detail:
-                column_map[t["name"]] = detail.get("columns", [])
+    cache_key = _schema_context_cache_key(
+        ts, user, tables, bool(terminal_assets), tenant_metadata, transformed_at
+    )
+    cached = _schema_context_cache.get(cache_key) if cacheable else None
+    if cached is not None:
+        value, timestamp = cached
+        if time.monotonic() - timestamp < _SCHEMA_CONTEXT_TTL:
+            return value
 
-        full_text = _render_full_schema(tables, column_map, last_materialized_at)
+    char_budget = SCHEMA_CONTEXT_CHAR_BUDGET
+    if terminal_assets:
+        char_budget -= len(_LINEAGE_HINT) + 2
+
+    # Column details only add lines, so when the table headers alone overflow the
+    # budget the compact block is inevitable and the columns are never fetched.
+    if _render_full_schema(tables, {}, last_materialized_at, char_budget=char_budget) is not None:
+        # Try full schema with columns
+        try:
+            ctx = await load_tenant_context(tenant.external_id)
+            described = await pipeline_describe_tables(
+                [t["name"] for t in tables], ctx, tenant_metadata, pipeline_config
+            )
+            column_map = {name: detail.get("columns", []) for name, detail in described.items()}
 
-        # Add lineage tool hint when transformation assets exist
-        if terminal_assets:
-            full_text += (
-                "\n\nThese tables are produced by a transformation pipeline. "
-                "Use the `get_lineage` tool to explore how any table was built."
+            full_text = _render_full_schema(
+                tables, column_map, last_materialized_at, char_budget=char_budget
             )
 
-        if len(full_text) <= SCHEMA_CONTEXT_CHAR_BUDGET:
-            return full_text
-    except Exception:
-        logger.debug(
-            "Could not fetch full schema for context injection, using compact", exc_info=True
-        )
+            # Add lineage tool hint when transformation assets exist
+            if full_text is not None and terminal_assets:
+                full_text = "\n\n".join((full_text, _LINEAGE_HINT))
+
+            if full_text is not None and len(full_text) <= SCHEMA_CONTEXT_CHAR_BUDGET:
+                _store_schema_context(cache_key, full_text)
+                return full_text
+        except Exception:
+            logger.debug(
+                "Could not fetch full schema for context injection, using compact", exc_info=True
+            )
+            # Don't cache a fallback caused by a transient failure
+            cacheable = False
 
     # Fall back to compact
     compact = _render_compact_schema(tables, last_materialized_at)
     if terminal_assets:
-        compact += (
-            "\n\nThese tables are produced by a transformation pipeline. "
-            "Use the `get_lineage` tool to explore how any table was built."
-        )
+        compact = "\n\n".join((compact, _LINEAGE_HINT))
+    if cacheable:
+        _store_schema_context(cache_key, compact)
     return compact
 
 
+def _store_schema_context(cache_key: str, value: str) -> None:
+    """Cache a rendered schema context, evicting the oldest entries past the size cap."""
+    _schema_context_cache[cache_key] = (value, time.monotonic())
+    _schema_context_cache.move_to_end(cache_key)
+    while len(_schema_context_cache) > _SCHEMA_CONTEXT_MAX_ENTRIES:
+        _schema_context_cache.popitem(last=False)
+
+
 def _llm_tool_schemas(tools: list, hidden_params: list[str]) -> list:
     """Build tool definitions for the LLM with parameters hidden from the schema.
 
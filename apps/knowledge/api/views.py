@@ -28,11 +28,14 @@ KNOWLEDGE_TYPES = {
         "model": KnowledgeEntry,
         "serializer": KnowledgeEntrySerializer,
         "search_fields": ["title", "content"],
+        # KnowledgeEntrySerializer reads created_by for every row
+        "select_related": ["created_by"],
     },
     "learning": {
         "model": AgentLearning,
         "serializer": AgentLearningSerializer,
         "search_fields": ["description", "original_error", "original_sql", "corrected_sql"],
+        "select_related": [],
     },
 }
 
@@ -78,7 +81,9 @@ class KnowledgeListCreateView(APIView):
             model = type_config["model"]
             serializer_class = type_config["serializer"]
 
-            queryset = model.objects.filter(workspace=workspace)
+            queryset = model.objects.filter(workspace=workspace).select_related(
+                *type_config["select_related"]
+            )
 
             if search_query:
                 search_q = Q()
@@ -27,6 +27,18 @@ class KnowledgeRetriever:
 
     MAX_AGENT_LEARNINGS = 20
 
+    # Rows are read as dicts of just the rendered fields; building model instances
+    # for every row is most of the cost of a large workspace's retrieval.
+    TABLE_FIELDS = (
+        "table_name",
+        "description",
+        "column_notes",
+        "data_quality_notes",
+        "related_tables",
+        "refresh_frequency",
+    )
+    LEARNING_FIELDS = ("description", "applies_to_tables", "confidence_score", "times_applied")
+
     def __init__(self, workspace: Workspace) -> None:
         self.workspace = workspace
 
@@ -50,51 +62,61 @@ class KnowledgeRetriever:
 
     async def _format_knowledge_entries(self) -> str:
         """Format knowledge entries as markdown sections."""
-        entries = KnowledgeEntry.objects.filter(workspace=self.workspace).order_by("title")
-
-        if not await entries.aexists():
+        entries = (
+            KnowledgeEntry.objects.filter(workspace=self.workspace)
+            .order_by("title")
+            .values("title", "content")
+        )
+
+        rows = [entry async for entry in entries]
+        if not rows:
             return ""
 
         lines: list[str] = ["## Knowledge Base", ""]
 
-        async for entry in entries:
-            lines.append(f"### {entry.title}")
+        for entry in rows:
+            lines.append(f"### {entry['title']}")
             lines.append("")
-            lines.append(entry.content)
+            lines.append(entry["content"])
             lines.append("")
 
         return "\n".join(lines).rstrip()
 
     async def _format_table_knowledge(self) -> str:
         """Format table knowledge with column notes and data quality notes."""
-        tables = TableKnowledge.objects.filter(workspace=self.workspace).order_by("table_name")
-
-        if not await tables.aexists():
+        tables = (
+            TableKnowledge.objects.filter(workspace=self.workspace)
+            .order_by("table_name")
+            .values(*self.TABLE_FIELDS)
+        )
+
+        rows = [table async for table in tables]
+        if not rows:
             return ""
 
         lines: list[str] = ["## Table Context (beyond schema)", ""]
 
-        async for table in tables:
-            lines.append(f"### {table.table_name}")
+        for table in rows:
+            lines.append(f"### {table['table_name']}")
             lines.append("")
-            lines.append(table.description)
+            lines.append(table["description"])
             lines.append("")
 
-            if table.column_notes:
+            if table["column_notes"]:
                 lines.append("**Column Notes:**")
-                for column, note in table.column_notes.items():
+                for column, note in table["column_notes"].items():
                     lines.append(f"- `{column}`: {note}")
                 lines.append("")
 
-            if table.data_quality_notes:
+            if table["data_quality_notes"]:
                 lines.append("**Data Quality Notes:**")
-                for note in table.data_quality_notes:
+                for note in table["data_quality_notes"]:
                     lines.append(f"- {note}")
                 lines.append("")
 
-            if table.related_tables:
+            if table["related_tables"]:
                 lines.append("**Related Tables:**")
-                for relation in table.related_tables:
+                for relation in table["related_tables"]:
                     if isinstance(relation, dict):
                         related_table = relation.get("table", "")
                         join_hint = relation.get("join_hint", "")
@@ -106,35 +128,40 @@ class KnowledgeRetriever:
                         lines.append(f"- `{relation}`")
                 lines.append("")
 
-            if table.refresh_frequency:
-                lines.append(f"**Refresh Frequency:** {table.refresh_frequency}")
+            if table["refresh_frequency"]:
+                lines.append(f"**Refresh Frequency:** {table['refresh_frequency']}")
                 lines.append("")
 
         return "\n".join(lines).rstrip()
 
     async def _format_agent_learnings(self) -> str:
         """Format active agent learnings as a bullet list."""
-        learnings = AgentLearning.objects.filter(
-            workspace=self.workspace,
-            is_active=True,
-        ).order_by("-confidence_score", "-times_applied")[: self.MAX_AGENT_LEARNINGS]
-
-        if not await learnings.aexists():
+        learnings = (
+            AgentLearning.objects.filter(
+                workspace=self.workspace,
+                is_active=True,
+            )
+            .order_by("-confidence_score", "-times_applied")
+            .values(*self.LEARNING_FIELDS)[: self.MAX_AGENT_LEARNINGS]
+        )
+
+        rows = [learning async for learning in learnings]
+        if not rows:
             return ""
 
         lines: list[str] = ["## Learned Corrections", ""]
 
-        async for learning in learnings:
-            lines.append(f"- {learning.description}")
+        for learning in rows:
+            lines.append(f"- {learning['description']}")
 
-            if learning.applies_to_tables:
-                tables_str = ", ".join(f"`{t}`" for t in learning.applies_to_tables)
+            if learning["applies_to_tables"]:
+                tables_str = ", ".join(f"`{t}`" for t in learning["applies_to_tables"])
                 lines.append(f"  - *Tables: {tables_str}*")
 
-            if learning.confidence_score >= 0.8:
+            if learning["confidence_score"] >= 0.8:
                 lines.append(
-                    f"  - *Confidence: {learning.confidence_score:.0%} "
-                    f"(applied {learning.times_applied} times)*"
+                    f"  - *Confidence: {learning['confidence_score']:.0%} "
+                    f"(applied {learning['times_applied']} times)*"
                 )
 
         return "\n".join(lines)
@@ -41,6 +41,12 @@ _CASE_CORE_COLUMNS = [
     ("closed", None),
 ]
 
+# Patterns used by slugify_model_name, which runs once per case property,
+# form question, case type and repeat group.
+_SLUG_SEPARATORS_RE = re.compile(r"[\s\-\.]+")
+_SLUG_INVALID_CHARS_RE = re.compile(r"[^a-z0-9_]")
+_SLUG_REPEATED_UNDERSCORES_RE = re.compile(r"_+")
+
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -57,9 +63,9 @@ def slugify_model_name(name: str) -> str:
     Raises ValueError if the result is empty.
     """
     slug = name.lower()
-    slug = re.sub(r"[\s\-\.]+", "_", slug)
-    slug = re.sub(r"[^a-z0-9_]", "", slug)
-    slug = re.sub(r"_+", "_", slug).strip("_")
+    slug = _SLUG_SEPARATORS_RE.sub("_", slug)
+    slug = _SLUG_INVALID_CHARS_RE.sub("", slug)
+    slug = _SLUG_REPEATED_UNDERSCORES_RE.sub("_", slug).strip("_")
     if not slug:
         raise ValueError(f"Cannot generate a valid model name from: {name!r}")
     return slug
@@ -4,19 +4,27 @@ API views for data dictionary and workspace schema management.
 
 import logging
 
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Max
+from django.db.models.fields.json import KeyTransform
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 from apps.knowledge.models import TableKnowledge
+from apps.transformations.models import TransformationRun
 from apps.users.models import TenantMembership
+from apps.workspaces.api.renderers import ORJSONRenderer
 from apps.workspaces.models import (
     MaterializationRun,
     SchemaState,
     TenantMetadata,
     TenantSchema,
+    Workspace,
     WorkspaceRole,
 )
 from apps.workspaces.services.schema_manager import SchemaManager, get_managed_db_connection
@@ -27,13 +35,19 @@ from mcp_server.services.metadata import pipeline_list_tables
 
 logger = logging.getLogger(__name__)
 
+COLUMNS_CACHE_TTL = 3600  # seconds — upper bound on staleness from out-of-band DDL
+
 
 def _resolve_tenant_schema(tenant):
-    """Return the active TenantSchema for the given tenant, or None."""
-    return TenantSchema.objects.filter(
-        tenant=tenant,
-        state__in=[SchemaState.ACTIVE, SchemaState.MATERIALIZING],
-    ).first()
+    """Return the active TenantSchema for the given tenant (with tenant loaded), or None."""
+    return (
+        TenantSchema.objects.filter(
+            tenant=tenant,
+            state__in=[SchemaState.ACTIVE, SchemaState.MATERIALIZING],
+        )
+        .select_related("tenant")
+        .first()
+    )
 
 
 def _schema_unavailable_response(tenant) -> Response | None:
@@ -107,6 +121,23 @@ def _get_all_columns(schema_name: str) -> dict[str, list[dict]]:
     return columns_by_table
 
 
+def _get_cached_columns(schema_name: str, run_id, transformed_at) -> dict[str, list[dict]]:
+    """Return _get_all_columns for *schema_name*, cached per schema rewrite.
+
+    Columns change when a MaterializationRun rebuilds the tables or a TransformationRun
+    rebuilds the views, so the latest run id and transformation completion time are
+    both part of the key. Empty results (including connection errors) are not cached.
+    """
+    transformed_key = transformed_at.isoformat() if transformed_at else "none"
+    cache_key = f"data_dictionary_columns:{schema_name}:{run_id}:{transformed_key}"
+    columns = cache.get(cache_key)
+    if columns is None:
+        columns = _get_all_columns(schema_name)
+        if columns:
+            cache.set(cache_key, columns, COLUMNS_CACHE_TTL)
+    return columns
+
+
 def _get_table_columns(schema_name: str, table_name: str) -> list[dict]:
     """Query managed DB for columns of a single table.
 
@@ -195,30 +226,99 @@ def _get_tenant_metadata(tenant):
     return TenantMetadata.objects.filter(tenant_membership__tenant=tenant).first()
 
 
-def _serialize_annotation(tk):
-    """Serialize a TableKnowledge instance to the frontend annotation shape."""
-    use_cases = tk.use_cases
-    data_quality_notes = tk.data_quality_notes
+# TableKnowledge fields exposed to the frontend as a table annotation
+_ANNOTATION_FIELDS = (
+    "description",
+    "use_cases",
+    "data_quality_notes",
+    "refresh_frequency",
+    "owner",
+    "related_tables",
+    "column_notes",
+)
+
+
+def _format_annotation(values):
+    """Convert a TableKnowledge ``.values()`` row to the frontend annotation shape."""
+    use_cases = values["use_cases"]
+    data_quality_notes = values["data_quality_notes"]
     return {
-        "description": tk.description,
+        "description": values["description"],
         "use_cases": "\n".join(use_cases) if isinstance(use_cases, list) else (use_cases or ""),
         "data_quality_notes": "\n".join(data_quality_notes)
         if isinstance(data_quality_notes, list)
         else (data_quality_notes or ""),
-        "refresh_frequency": tk.refresh_frequency,
-        "owner": tk.owner,
-        "related_tables": tk.related_tables or [],
-        "column_notes": tk.column_notes or {},
+        "refresh_frequency": values["refresh_frequency"],
+        "owner": values["owner"],
+        "related_tables": values["related_tables"] or [],
+        "column_notes": values["column_notes"] or {},
     }
 
 
+def _serialize_annotation(tk):
+    """Serialize a TableKnowledge instance to the frontend annotation shape."""
+    return _format_annotation({field: getattr(tk, field) for field in _ANNOTATION_FIELDS})
+
+
+# Accepted types for each annotation field in a PUT payload; other keys are ignored.
+# null is always accepted and clears the field.
+_ANNOTATION_PAYLOAD_TYPES = {
+    "description": str,
+    "use_cases": (str, list),
+    "data_quality_notes": (str, list),
+    "refresh_frequency": str,
+    "owner": str,
+    "related_tables": (str, list),
+    "column_notes": dict,
+}
+
+
+def _validate_annotation_payload(data) -> str | None:
+    """Check every annotation field in *data* in one pass.
+
+    Returns an error message for the first field with the wrong type, or None.
+    """
+    for field, expected in _ANNOTATION_PAYLOAD_TYPES.items():
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected):
+            return f"Invalid type for '{field}'."
+    return None
+
+
 def _get_annotation(workspace, table_name):
     """Return serialized TableKnowledge annotation for a table, or None."""
-    try:
-        tk = TableKnowledge.objects.get(workspace=workspace, table_name=table_name)
-        return _serialize_annotation(tk)
-    except TableKnowledge.DoesNotExist:
-        return None
+    values = (
+        TableKnowledge.objects.filter(workspace=workspace, table_name=table_name)
+        .values(*_ANNOTATION_FIELDS)
+        .first()
+    )
+    return _format_annotation(values) if values else None
+
+
+def _get_annotations(workspace, table_names):
+    """Return serialized TableKnowledge annotations for the given tables, keyed by name.
+
+    Fetches every annotation in one query; tables without one are absent from the dict.
+    """
+    rows = (
+        TableKnowledge.objects.filter(workspace=workspace, table_name__in=table_names)
+        .order_by()  # keyed into a dict, so skip the default ordering
+        .values("table_name", *_ANNOTATION_FIELDS)
+    )
+    return {row["table_name"]: _format_annotation(row) for row in rows}
+
+
+def _get_legacy_table(workspace, qualified_name):
+    """Return one table entry from the legacy data_dictionary JSONField, or None.
+
+    Extracts the key inside Postgres so the whole dictionary is never loaded.
+    """
+    return (
+        Workspace.objects.filter(pk=workspace.pk)
+        .annotate(table=KeyTransform(qualified_name, KeyTransform("tables", "data_dictionary")))
+        .values_list("table", flat=True)
+        .first()
+    )
 
 
 class DataDictionaryView(APIView):
@@ -231,19 +331,18 @@ class DataDictionaryView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES[1:]]
 
     def get(self, request, workspace_id):
         workspace, membership, err = resolve_workspace(request, workspace_id)
         if err:
             return err
 
-        unavailable = _schema_unavailable_response(workspace.tenant)
-        if unavailable is not None:
-            return unavailable
-
-        tenant_schema = _resolve_tenant_schema(workspace.tenant)
+        # Workspace.tenant is a query, so resolve it once
+        tenant = workspace.tenant
+        tenant_schema = _resolve_tenant_schema(tenant) if tenant else None
         if tenant_schema is None:
-            return Response(
+            return _schema_unavailable_response(tenant) or Response(
                 {"schema_status": "unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         return self._get_from_pipeline(workspace, tenant_schema)
@@ -257,28 +356,37 @@ class DataDictionaryView(APIView):
             .order_by("-completed_at")
             .first()
         )
+        if last_run is None:
+            # Nothing has been materialized yet, so there are no tables to describe
+            return Response({"tables": {}, "generated_at": None})
 
-        pipeline_name = last_run.pipeline if last_run else "commcare_sync"
-        pipeline_config = get_registry().get(pipeline_name) or get_registry().get("commcare_sync")
+        registry = get_registry()
+        pipeline_config = registry.get(last_run.pipeline) or registry.get("commcare_sync")
 
         tables_list = [
             t
-            for t in pipeline_list_tables(tenant_schema, pipeline_config)
+            for t in async_to_sync(pipeline_list_tables)(tenant_schema, pipeline_config)
             if not t["name"].startswith("stg_")
         ]
         if not tables_list:
             return Response({"tables": {}, "generated_at": None})
 
         schema_name = tenant_schema.schema_name
-        all_columns = _get_all_columns(schema_name)
+        transformed_at = TransformationRun.objects.filter(
+            tenant_id=tenant_schema.tenant_id
+        ).aggregate(latest=Max("completed_at"))["latest"]
+        all_columns = _get_cached_columns(schema_name, last_run.id, transformed_at)
         tenant = tenant_schema.tenant
         tenant_metadata = _get_tenant_metadata(tenant)
+        annotations = _get_annotations(
+            workspace, [f"{schema_name}.{t['name']}" for t in tables_list]
+        )
 
         enriched_tables = {}
         for table_info in tables_list:
             table_name = table_info["name"]
             qualified_name = f"{schema_name}.{table_name}"
-            annotation = _get_annotation(workspace, qualified_name)
+            annotation = annotations.get(qualified_name)
             source_metadata = _build_source_metadata(table_name, tenant_metadata)
             entry = {
                 "schema": schema_name,
@@ -293,7 +401,7 @@ class DataDictionaryView(APIView):
                 entry["annotation"] = annotation
             enriched_tables[qualified_name] = entry
 
-        generated_at = last_run.completed_at if last_run else None
+        generated_at = last_run.completed_at
         return Response(
             {
                 "tables": enriched_tables,
@@ -400,6 +508,7 @@ class TableDetailView(APIView):
     """
 
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES[1:]]
 
     def _get_table_data(self, workspace, tenant, qualified_name):
         """Return table data dict, sourcing from pipeline models or legacy JSONField."""
@@ -414,8 +523,7 @@ class TableDetailView(APIView):
                         return table_data
 
         # Fallback: legacy data_dictionary JSONField
-        raw_dict = workspace.data_dictionary or {}
-        return raw_dict.get("tables", {}).get(qualified_name)
+        return _get_legacy_table(workspace, qualified_name)
 
     def _get_pipeline_table(self, tenant_schema, schema_name, table_name):
         """Return table data from pipeline models, or None if not found or hidden."""
@@ -433,7 +541,9 @@ class TableDetailView(APIView):
         pipeline_name = last_run.pipeline if last_run else "commcare_sync"
         pipeline_config = get_registry().get(pipeline_name) or get_registry().get("commcare_sync")
 
-        known = {t["name"] for t in pipeline_list_tables(tenant_schema, pipeline_config)}
+        known = {
+            t["name"] for t in async_to_sync(pipeline_list_tables)(tenant_schema, pipeline_config)
+        }
         if table_name not in known:
             return None
 
@@ -453,15 +563,18 @@ class TableDetailView(APIView):
         return entry
 
     def get(self, request, workspace_id, qualified_name):
-        workspace, membership, err = resolve_workspace(request, workspace_id)
+        workspace, membership, err = resolve_workspace(
+            request, workspace_id, defer_data_dictionary=True
+        )
         if err:
             return err
 
-        unavailable = _schema_unavailable_response(workspace.tenant)
+        tenant = workspace.tenant
+        unavailable = _schema_unavailable_response(tenant)
         if unavailable is not None:
             return unavailable
 
-        table_data = self._get_table_data(workspace, workspace.tenant, qualified_name)
+        table_data = self._get_table_data(workspace, tenant, qualified_name)
         if table_data is None:
             return Response({"error": "Table not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -474,7 +587,9 @@ class TableDetailView(APIView):
         return Response(response_data)
 
     def put(self, request, workspace_id, qualified_name):
-        workspace, membership, err = resolve_workspace(request, workspace_id)
+        workspace, membership, err = resolve_workspace(
+            request, workspace_id, defer_data_dictionary=True
+        )
         if err:
             return err
 
@@ -489,6 +604,9 @@ class TableDetailView(APIView):
             return Response({"error": "Table not found."}, status=status.HTTP_404_NOT_FOUND)
 
         data = request.data
+        error = _validate_annotation_payload(data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
         # Convert string fields to list for storage in JSONField
         def _to_list(value):
@@ -498,7 +616,7 @@ class TableDetailView(APIView):
                 return [line for line in value.splitlines() if line.strip()]
             return []
 
-        related_tables = data.get("related_tables", [])
+        related_tables = data.get("related_tables") or []
         if isinstance(related_tables, str):
             related_tables = [t.strip() for t in related_tables.split(",") if t.strip()]
 
@@ -507,14 +625,13 @@ class TableDetailView(APIView):
             table_name=qualified_name,
             defaults={"description": "", "updated_by": request.user},
         )
-        tk.description = data.get("description", tk.description)
+        tk.description = data.get("description", tk.description) or ""
         tk.use_cases = _to_list(data.get("use_cases", ""))
         tk.data_quality_notes = _to_list(data.get("data_quality_notes", ""))
-        tk.refresh_frequency = data.get("refresh_frequency", tk.refresh_frequency)
-        tk.owner = data.get("owner", tk.owner)
+        tk.refresh_frequency = data.get("refresh_frequency", tk.refresh_frequency) or ""
+        tk.owner = data.get("owner", tk.owner) or ""
         tk.related_tables = related_tables
-        column_notes = data.get("column_notes", {})
-        tk.column_notes = column_notes if isinstance(column_notes, dict) else {}
+        tk.column_notes = data.get("column_notes") or {}
         tk.updated_by = request.user
         tk.save()
 
@@ -9,17 +9,19 @@ from apps.workspaces.models import WorkspaceMembership
 _ACCESS_DENIED = {"error": "Workspace not found or access denied."}
 
 
-def resolve_workspace_drf(request, workspace_id):
+def resolve_workspace_drf(request, workspace_id, *, defer_data_dictionary=False):
     """Resolve Workspace from workspace_id URL path parameter (DRF views).
 
     workspace_id is the Workspace.id (UUID) and the requesting user must be a member.
     Returns (workspace, membership, None) on success or (None, None, Response(403)) on error.
+    Views that only read single keys of the legacy data_dictionary blob can pass
+    defer_data_dictionary=True to skip loading it.
     """
+    memberships = WorkspaceMembership.objects.select_related("workspace")
+    if defer_data_dictionary:
+        memberships = memberships.defer("workspace__data_dictionary")
     try:
-        membership = WorkspaceMembership.objects.select_related("workspace").get(
-            workspace_id=workspace_id,
-            user=request.user,
-        )
+        membership = memberships.get(workspace_id=workspace_id, user=request.user)
     except WorkspaceMembership.DoesNotExist:
         return (
             None,
@@ -34,6 +34,10 @@ DATABASES = {
         "PASSWORD": env("DATABASE_PASSWORD", default=_defaults["PASSWORD"]),
         "HOST": env("DATABASE_HOST", default=_defaults["HOST"]),
         "PORT": env("DATABASE_PORT", default=_defaults["PORT"]),
+        # Test data is disposable, so don't wait on the WAL flush at every commit.
+        # Transactional tests commit and truncate constantly; this is the Postgres
+        # equivalent of running SQLite with synchronous=OFF.
+        "OPTIONS": {"options": "-c synchronous_commit=off"},
     }
 }
 
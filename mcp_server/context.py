@@ -14,6 +14,8 @@ from django.conf import settings
 
 from apps.workspaces.models import SchemaState, TenantSchema, Workspace, WorkspaceViewSchema
 
+_SAFE_SCHEMA_RE = re.compile(r"^[a-z][a-z0-9_]*$")
+
 
 @dataclass(frozen=True)
 class QueryContext:
@@ -137,7 +139,7 @@ def _parse_db_url(url: str, schema: str) -> dict:
     # Defensive validation: schema_name must only contain safe characters before
     # embedding in the options string. _sanitize_schema_name already guarantees
     # this, but we re-check here as defence-in-depth.
-    if not re.match(r"^[a-z][a-z0-9_]*$", schema):
+    if not _SAFE_SCHEMA_RE.match(schema):
         raise ValueError(f"Invalid schema name: {schema!r}")
 
     parsed = urlparse(url)
@@ -17,7 +17,6 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 import yaml
-from dbt.cli.main import dbtRunner
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +24,17 @@ logger = logging.getLogger(__name__)
 _dbt_lock = threading.Lock()
 
 
+def _dbt_runner():
+    """Return a new dbtRunner, importing dbt on first use.
+
+    Importing dbt takes seconds, and this module is pulled in by the transformation
+    views, so web processes that never run dbt would otherwise pay for it at startup.
+    """
+    from dbt.cli.main import dbtRunner
+
+    return dbtRunner()
+
+
 def generate_profiles_yml(
     output_path: Path,
     schema_name: str,
@@ -94,7 +104,7 @@ def run_dbt(
     logger.info("Invoking dbt programmatically: %s", " ".join(cli_args))
 
     with _dbt_lock:
-        dbt = dbtRunner()
+        dbt = _dbt_runner()
         res = dbt.invoke(cli_args)
 
     if not res.success:
@@ -141,7 +151,7 @@ def run_dbt_test(
     logger.info("Invoking dbt test: %s", " ".join(cli_args))
 
     with _dbt_lock:
-        dbt = dbtRunner()
+        dbt = _dbt_runner()
         res = dbt.invoke(cli_args)
 
     # Always parse results — dbt sets success=False on test failures but still
@@ -21,6 +21,7 @@ from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from django.utils import timezone
 from psycopg import sql as psql
 
@@ -345,6 +346,19 @@ _FORMS_INSERT = psql.SQL(
 )
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize a value for a JSONB column.
+
+    Every synced row carries one or more JSON payloads, so this runs once per
+    column per row; orjson is several times faster than the stdlib encoder here.
+    Payloads orjson rejects (integers beyond 64 bits) fall back to json.dumps.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
 def _write_cases(pages: Iterator[list[dict]], schema_name: str, conn: Any) -> int:
     """Create the cases table and bulk-insert all pages. Returns total row count."""
     sid = psql.Identifier(schema_name)
@@ -391,8 +405,8 @@ def _write_cases(pages: Iterator[list[dict]], schema_name: str, conn: Any) -> in
                 c.get("indexed_on", ""),
                 c.get("closed", False),
                 c.get("date_closed") or "",
-                json.dumps(c.get("properties", {})),
-                json.dumps(c.get("indices", {})),
+                _json_dumps(c.get("properties", {})),
+                _json_dumps(c.get("indices", {})),
             )
             for c in page
         ]
@@ -436,8 +450,8 @@ def _write_forms(pages: Iterator[list[dict]], schema_name: str, conn: Any) -> in
                 f.get("received_on", ""),
                 f.get("server_modified_on", ""),
                 f.get("app_id", ""),
-                json.dumps(f.get("form_data", {})),
-                json.dumps(f.get("case_ids", [])),
+                _json_dumps(f.get("form_data", {})),
+                _json_dumps(f.get("case_ids", [])),
             )
             for f in page
         ]
@@ -454,13 +468,13 @@ def _json_or_none(value: Any) -> str | None:
     """Serialize a value to a JSON string, or return None for SQL NULL.
 
     Use for nullable JSONB columns (flag_reason, claim_limits) where the
-    v2 export may return ``null``. json.dumps(None) would produce the
+    v2 export may return ``null``. Serializing None would produce the
     literal string "null", which inserts as JSONB ``null`` — not the
     same as SQL NULL. This helper preserves the distinction.
     """
     if value is None:
         return None
-    return json.dumps(value)
+    return _json_dumps(value)
 
 
 _CONNECT_VISITS_INSERT = psql.SQL(
@@ -603,7 +617,7 @@ def _write_connect_visits(pages: Iterator[list[dict]], schema_name: str, conn: A
                 r.get("location", ""),
                 r.get("flagged"),
                 _json_or_none(r.get("flag_reason")),
-                json.dumps(r.get("form_json") or {}),
+                _json_dumps(r.get("form_json") or {}),
                 r.get("completed_work"),
                 r.get("status_modified_date"),
                 r.get("review_status", ""),
@@ -612,7 +626,7 @@ def _write_connect_visits(pages: Iterator[list[dict]], schema_name: str, conn: A
                 r.get("date_created"),
                 r.get("completed_work_id"),
                 r.get("deliver_unit_id"),
-                json.dumps(r.get("images") or []),
+                _json_dumps(r.get("images") or []),
             )
             for r in page
         ]
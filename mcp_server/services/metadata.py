@@ -8,6 +8,8 @@ and pipeline registry definitions.
 from __future__ import annotations
 
 import logging
+from itertools import groupby
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 from django.db import models
@@ -127,10 +129,53 @@ async def pipeline_describe_table(
         return None
 
     source_descriptions = {s.physical_table_name: s.description for s in pipeline_config.sources}
+    return _build_table_detail(table_name, result["rows"], source_descriptions, tenant_metadata)
+
+
+async def pipeline_describe_tables(
+    table_names: list[str],
+    ctx: QueryContext,
+    tenant_metadata: TenantMetadata | None,
+    pipeline_config: PipelineConfig,
+) -> dict[str, dict]:
+    """Describe several tables with a single information_schema query.
+
+    Returns a dict keyed by table name with the same shape as pipeline_describe_table.
+    Tables that do not exist in information_schema are omitted.
+    """
+    if not table_names:
+        return {}
+
+    result = await _execute_async_parameterized(
+        ctx,
+        "SELECT table_name, column_name, data_type, is_nullable, column_default "
+        "FROM information_schema.columns "
+        "WHERE table_schema = %s AND table_name = ANY(%s) "
+        "ORDER BY table_name, ordinal_position",
+        (ctx.schema_name, list(table_names)),
+        ctx.max_query_timeout_seconds,
+    )
+
+    source_descriptions = {s.physical_table_name: s.description for s in pipeline_config.sources}
+    return {
+        table_name: _build_table_detail(
+            table_name, [row[1:] for row in rows], source_descriptions, tenant_metadata
+        )
+        for table_name, rows in groupby(result.get("rows") or [], key=itemgetter(0))
+    }
+
+
+def _build_table_detail(
+    table_name: str,
+    rows: list[list],
+    source_descriptions: dict[str, str],
+    tenant_metadata: TenantMetadata | None,
+) -> dict:
+    """Build a describe_table payload from (column_name, data_type, is_nullable, default) rows."""
     jsonb_annotations = _build_jsonb_annotations(table_name, tenant_metadata)
 
     columns = []
-    for row in result["rows"]:
+    for row in rows:
         col_name, data_type, is_nullable, default = row
         columns.append(
             {
@@ -170,19 +215,23 @@ def _build_jsonb_annotations(
     elif table_name == "raw_forms":
         form_definitions = metadata.get("form_definitions", {})
         if form_definitions:
-            names = []
-            for xmlns, fd in form_definitions.items():
-                name = fd.get("name", xmlns)
-                if isinstance(name, dict):
-                    # name is a translations dict e.g. {"en": "My Form"} — take first value
-                    name = next(iter(name.values()), xmlns)
-                names.append(str(name))
-            form_names = ", ".join(names)
+            form_names = ", ".join(
+                _form_display_name(xmlns, fd) for xmlns, fd in form_definitions.items()
+            )
             return {"form_data": f"Contains form submission data. Available forms: {form_names}"}
 
     return {}
 
 
+def _form_display_name(xmlns: str, form_definition: dict) -> str:
+    """Return a form's display name, falling back to its xmlns."""
+    name = form_definition.get("name", xmlns)
+    if isinstance(name, dict):
+        # name is a translations dict e.g. {"en": "My Form"} — take first value
+        name = next(iter(name.values()), xmlns)
+    return str(name)
+
+
 async def transformation_aware_list_tables(
     tenant_schema: TenantSchema,
     pipeline_config: PipelineConfig,
@@ -207,17 +256,25 @@ async def transformation_aware_list_tables(
     if workspace_id:
         visible_q = visible_q | models.Q(workspace_id=workspace_id)
 
+    # Load the visible assets once and walk the chains in memory
+    visible_assets = {
+        row["id"]: (row["name"], row["replaces_id"])
+        async for row in TransformationAsset.objects.filter(visible_q).values(
+            "id", "name", "replaces_id"
+        )
+    }
+
     replaced_names = set()
     for asset in terminal_assets:
         next_id = asset.replaces_id
         visited = set()
         while next_id and next_id not in visited:
             visited.add(next_id)
-            upstream = await TransformationAsset.objects.filter(visible_q, id=next_id).afirst()
+            upstream = visible_assets.get(next_id)
             if upstream is None:
                 break
-            replaced_names.add(upstream.name)
-            next_id = upstream.replaces_id
+            upstream_name, next_id = upstream
+            replaced_names.add(upstream_name)
 
     # Start with raw tables, excluding replaced ones and terminal asset names
     raw_tables = await pipeline_list_tables(tenant_schema, pipeline_config)
@@ -255,11 +312,10 @@ async def pipeline_get_metadata(
     if not tables_list:
         return {"tables": {}, "relationships": []}
 
-    tables = {}
-    for t in tables_list:
-        detail = await pipeline_describe_table(t["name"], ctx, tenant_metadata, pipeline_config)
-        if detail:
-            tables[t["name"]] = detail
+    described = await pipeline_describe_tables(
+        [t["name"] for t in tables_list], ctx, tenant_metadata, pipeline_config
+    )
+    tables = {t["name"]: described[t["name"]] for t in tables_list if t["name"] in described}
 
     relationships = [
         {
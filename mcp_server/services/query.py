@@ -68,16 +68,21 @@ async def _execute_async(ctx: QueryContext, sql: str, timeout_seconds: int) -> d
 async def _execute_async_parameterized(
     ctx: QueryContext, sql: str, params: tuple, timeout_seconds: int
 ) -> dict[str, Any]:
-    """Run a parameterized SQL query asynchronously. No validation or LIMIT injection."""
+    """Run a parameterized SQL query asynchronously. No validation or LIMIT injection.
+
+    The session setup and the query are sent as a single pipeline, so a call costs one
+    round-trip to the server after connecting instead of three.
+    """
     async with await psycopg.AsyncConnection.connect(
         **ctx.connection_params, autocommit=True
     ) as conn:
         async with conn.cursor() as cursor:
-            await cursor.execute(
-                psql.SQL("SET search_path TO {}").format(psql.Identifier(ctx.schema_name))
-            )
-            await cursor.execute(f"SET statement_timeout TO '{timeout_seconds}s'")
-            await cursor.execute(sql, params)
+            async with conn.pipeline():
+                await cursor.execute(
+                    psql.SQL("SET search_path TO {}").format(psql.Identifier(ctx.schema_name))
+                )
+                await cursor.execute(f"SET statement_timeout TO '{timeout_seconds}s'")
+                await cursor.execute(sql, params)
 
             columns: list[str] = []
             rows: list[list[Any]] = []
@@ -158,14 +163,15 @@ def _classify_error(exc: Exception) -> tuple[str, str]:
 
     if isinstance(exc, psycopg.Error):
         msg = str(exc)
-        if "password authentication failed" in msg.lower():
+        lowered = msg.lower()
+        if "password authentication failed" in lowered:
             return (
                 CONNECTION_ERROR,
                 "Database authentication failed. Please contact an administrator.",
             )
-        if "could not connect" in msg.lower():
+        if "could not connect" in lowered:
             return CONNECTION_ERROR, "Could not connect to the database. Please try again later."
-        if "does not exist" in msg.lower():
+        if "does not exist" in lowered:
             return VALIDATION_ERROR, f"Database error: {msg}"
         return CONNECTION_ERROR, f"Query execution failed: {msg}"
 
@@ -247,8 +247,12 @@ class SQLValidator:
 
     def _validate_no_dangerous_functions(self, statement: exp.Expression, sql: str) -> None:
         """Check for dangerous function calls in the query."""
+        # exp.Anonymous (raw function calls) subclasses exp.Func, so one walk covers both
         for func in statement.find_all(exp.Func):
-            func_name = func.name.lower() if func.name else ""
+            name = func.name
+            if not name:
+                continue
+            func_name = name.lower()
             if func_name in DANGEROUS_FUNCTIONS:
                 raise SQLValidationError(
                     f"Function '{func_name}' is not allowed for security reasons.",
@@ -256,37 +260,29 @@ class SQLValidator:
                     error_type="dangerous_function",
                 )
 
-        # Also check for Anonymous functions (raw function calls)
-        for anon in statement.find_all(exp.Anonymous):
-            func_name = anon.name.lower() if anon.name else ""
-            if func_name in DANGEROUS_FUNCTIONS:
+    def _validate_table_access(self, statement: exp.Expression, sql: str) -> None:
+        """Validate that only allowed schemas are accessed."""
+        # Only schema-qualified references need checking; unqualified names
+        # resolve through search_path.
+        qualified_schemas = [
+            t["schema"] for t in self._extract_tables(statement) if t.get("schema")
+        ]
+        if not qualified_schemas:
+            return
+
+        # Build the allowlist once per statement rather than once per table
+        all_allowed_schemas = {"public", self.schema.lower()}
+        all_allowed_schemas.update(s.lower() for s in self.allowed_schemas)
+
+        for table_schema in qualified_schemas:
+            if table_schema.lower() not in all_allowed_schemas:
                 raise SQLValidationError(
-                    f"Function '{func_name}' is not allowed for security reasons.",
+                    f"Access to schema '{table_schema}' is not permitted. "
+                    f"Allowed schemas: {', '.join(sorted(all_allowed_schemas))}",
                     sql=sql,
-                    error_type="dangerous_function",
+                    error_type="schema_not_allowed",
                 )
 
-    def _validate_table_access(self, statement: exp.Expression, sql: str) -> None:
-        """Validate that only allowed schemas are accessed."""
-        tables_accessed = self._extract_tables(statement)
-
-        for table_info in tables_accessed:
-            table_schema = table_info.get("schema")
-
-            # Validate schema if specified in the query
-            if table_schema:
-                # Build list of allowed schemas
-                all_allowed_schemas = {"public", self.schema.lower()}
-                all_allowed_schemas.update(s.lower() for s in self.allowed_schemas)
-
-                if table_schema.lower() not in all_allowed_schemas:
-                    raise SQLValidationError(
-                        f"Access to schema '{table_schema}' is not permitted. "
-                        f"Allowed schemas: {', '.join(sorted(all_allowed_schemas))}",
-                        sql=sql,
-                        error_type="schema_not_allowed",
-                    )
-
     def _extract_tables(self, statement: exp.Expression) -> list[dict[str, str]]:
         """
         Extract all table references from a SQL statement.
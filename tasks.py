@@ -28,13 +28,16 @@ def makemigrations(c: Context) -> None:
 
 
 @task
-def test(c: Context, path: str = "", k: str = "") -> None:
-    """Run backend tests. Use -p for a file path, -k for a test name filter."""
+def test(c: Context, path: str = "", k: str = "", workers: str = "") -> None:
+    """Run backend tests. Use -p for a file path, -k for a test name filter,
+    -w to spread tests over xdist workers (a count or "auto")."""
     cmd = "uv run pytest"
     if path:
         cmd += f" {path}"
     if k:
         cmd += f" -k {k}"
+    if workers:
+        cmd += f" -n {workers}"
     c.run(cmd, pty=True)
 
 
@@ -132,8 +132,10 @@ async def test_fetch_schema_context_active_full(mock_tenant, mock_user):
             new=AsyncMock(return_value=mock_tables),
         ),
         patch(
-            "apps.agents.graph.base.pipeline_describe_table",
-            new=AsyncMock(return_value={"columns": [{"name": "case_id", "type": "text"}]}),
+            "apps.agents.graph.base.pipeline_describe_tables",
+            new=AsyncMock(
+                return_value={"cases": {"columns": [{"name": "case_id", "type": "text"}]}}
+            ),
         ),
         patch("apps.agents.graph.base._render_full_schema") as mock_full,
         patch(
@@ -232,3 +234,234 @@ async def test_build_system_prompt_no_schema_status_call():
     assert "call `get_schema_status`" not in prompt
     assert "start of every conversation" not in prompt
     assert "## Data Availability" in prompt
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_fetch_schema_context_cached_until_rematerialized(mock_tenant, mock_user):
+    """Rendered context is reused until the table fingerprint changes."""
+    from apps.agents.graph.base import _schema_context_cache
+    from apps.workspaces.models import SchemaState
+
+    _schema_context_cache.clear()
+
+    mock_ts = MagicMock()
+    mock_ts.id = "ts-1"
+    mock_ts.state = SchemaState.ACTIVE
+
+    tables = [
+        {
+            "name": "cases",
+            "description": "CommCare cases",
+            "row_count": 100,
+            "materialized_at": "2026-03-02T10:00:00",
+        },
+    ]
+    describe = AsyncMock(return_value={"cases": {"columns": [{"name": "case_id", "type": "text"}]}})
+
+    with (
+        patch("apps.agents.graph.base.TenantSchema") as MockTS,
+        patch("apps.agents.graph.base.get_registry") as mock_registry,
+        patch(
+            "apps.agents.graph.base.pipeline_list_tables",
+            new=AsyncMock(side_effect=lambda *a: [dict(t) for t in tables]),
+        ),
+        patch("apps.agents.graph.base.pipeline_describe_tables", new=describe),
+        patch(
+            "apps.agents.graph.base.load_tenant_context", new=AsyncMock(return_value=MagicMock())
+        ),
+        patch("apps.workspaces.models.TenantMetadata") as MockTM,
+        patch(
+            "apps.transformations.services.lineage.aget_terminal_assets",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        MockTS.objects.filter.return_value.afirst = AsyncMock(return_value=mock_ts)
+        mock_registry.return_value.get.return_value = MagicMock()
+        MockTM.objects.filter.return_value.afirst = AsyncMock(return_value=None)
+
+        first = await _fetch_schema_context(mock_tenant, mock_user)
+        second = await _fetch_schema_context(mock_tenant, mock_user)
+        assert first == second
+        assert describe.await_count == 1
+
+        tables[0]["materialized_at"] = "2026-03-03T10:00:00"
+        third = await _fetch_schema_context(mock_tenant, mock_user)
+
+    assert describe.await_count == 2
+    assert "2026-03-03T10:00:00" in third
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_fetch_schema_context_cache_invalidated_by_metadata_update(mock_tenant, mock_user):
+    """Saving the user's TenantMetadata (column annotations) produces a new cache key."""
+    from datetime import UTC, datetime
+
+    from apps.agents.graph.base import _schema_context_cache
+    from apps.workspaces.models import SchemaState
+
+    _schema_context_cache.clear()
+
+    mock_ts = MagicMock()
+    mock_ts.id = "ts-annotated"
+    mock_ts.state = SchemaState.ACTIVE
+
+    tables = [{"name": "cases", "row_count": 100, "materialized_at": "2026-03-02T10:00:00"}]
+    describe = AsyncMock(return_value={"cases": {"columns": [{"name": "case_id", "type": "text"}]}})
+    metadata = MagicMock(updated_at=datetime(2026, 3, 2, 10, tzinfo=UTC))
+
+    with (
+        patch("apps.agents.graph.base.TenantSchema") as MockTS,
+        patch("apps.agents.graph.base.get_registry") as mock_registry,
+        patch("apps.agents.graph.base.pipeline_list_tables", new=AsyncMock(return_value=tables)),
+        patch("apps.agents.graph.base.pipeline_describe_tables", new=describe),
+        patch(
+            "apps.agents.graph.base.load_tenant_context", new=AsyncMock(return_value=MagicMock())
+        ),
+        patch("apps.workspaces.models.TenantMetadata") as MockTM,
+        patch(
+            "apps.transformations.services.lineage.aget_terminal_assets",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        MockTS.objects.filter.return_value.afirst = AsyncMock(return_value=mock_ts)
+        mock_registry.return_value.get.return_value = MagicMock()
+        MockTM.objects.filter.return_value.afirst = AsyncMock(return_value=metadata)
+
+        await _fetch_schema_context(mock_tenant, mock_user)
+        await _fetch_schema_context(mock_tenant, mock_user)
+        assert describe.await_count == 1
+
+        metadata.updated_at = datetime(2026, 3, 2, 11, tzinfo=UTC)
+        await _fetch_schema_context(mock_tenant, mock_user)
+
+    assert describe.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_fetch_schema_context_cache_invalidated_by_transformation_run(mock_tenant, mock_user):
+    """Re-running transformations or re-describing an asset produces a new cache key."""
+    from datetime import UTC, datetime
+
+    from apps.agents.graph.base import _schema_context_cache
+    from apps.workspaces.models import SchemaState
+
+    _schema_context_cache.clear()
+
+    mock_ts = MagicMock()
+    mock_ts.id = "ts-transformed"
+    mock_ts.state = SchemaState.ACTIVE
+
+    # Terminal assets are listed without materialized_at
+    tables = [{"name": "cases_clean", "description": "Cleaned cases", "materialized_at": None}]
+    describe = AsyncMock(
+        return_value={"cases_clean": {"columns": [{"name": "case_id", "type": "text"}]}}
+    )
+    latest_run = {"latest": datetime(2026, 3, 2, 10, tzinfo=UTC)}
+
+    with (
+        patch("apps.agents.graph.base.TenantSchema") as MockTS,
+        patch("apps.agents.graph.base.get_registry") as mock_registry,
+        patch(
+            "apps.agents.graph.base.transformation_aware_list_tables",
+            new=AsyncMock(side_effect=lambda *a, **kw: [dict(t) for t in tables]),
+        ),
+        patch("apps.agents.graph.base.pipeline_describe_tables", new=describe),
+        patch(
+            "apps.agents.graph.base.load_tenant_context", new=AsyncMock(return_value=MagicMock())
+        ),
+        patch("apps.workspaces.models.TenantMetadata") as MockTM,
+        patch("apps.transformations.models.TransformationRun") as MockRun,
+        patch(
+            "apps.transformations.services.lineage.aget_terminal_assets",
+            new=AsyncMock(return_value=[MagicMock()]),
+        ),
+    ):
+        MockTS.objects.filter.return_value.afirst = AsyncMock(return_value=mock_ts)
+        mock_registry.return_value.get.return_value = MagicMock()
+        MockTM.objects.filter.return_value.afirst = AsyncMock(return_value=None)
+        MockRun.objects.filter.return_value.aaggregate = AsyncMock(
+            side_effect=lambda **kw: dict(latest_run)
+        )
+
+        await _fetch_schema_context(mock_tenant, mock_user)
+        await _fetch_schema_context(mock_tenant, mock_user)
+        assert describe.await_count == 1
+
+        latest_run["latest"] = datetime(2026, 3, 2, 11, tzinfo=UTC)
+        await _fetch_schema_context(mock_tenant, mock_user)
+        assert describe.await_count == 2
+
+        tables[0]["description"] = "Cleaned and deduplicated cases"
+        result = await _fetch_schema_context(mock_tenant, mock_user)
+
+    assert describe.await_count == 3
+    assert "Cleaned and deduplicated cases" in result
+
+
+def test_store_schema_context_evicts_oldest_entries_past_cap():
+    """The cache never grows past its cap, dropping the least recently stored keys."""
+    from apps.agents.graph import base
+
+    base._schema_context_cache.clear()
+    with patch.object(base, "_SCHEMA_CONTEXT_MAX_ENTRIES", 3):
+        for i in range(5):
+            base._store_schema_context(f"key-{i}", f"value-{i}")
+        base._store_schema_context("key-2", "value-2b")
+
+    assert list(base._schema_context_cache) == ["key-3", "key-4", "key-2"]
+    assert base._schema_context_cache["key-2"][0] == "value-2b"
+    base._schema_context_cache.clear()
+
+
+def test_render_full_schema_stops_at_char_budget():
+    """A budgeted render matches the unbudgeted text, or gives up once it is exceeded."""
+    from apps.agents.graph.base import _render_full_schema
+
+    tables = [{"name": f"table_{i}", "row_count": i} for i in range(50)]
+    column_map = {t["name"]: [{"name": "id", "type": "integer"}] for t in tables}
+    full = _render_full_schema(tables, column_map, None)
+
+    assert _render_full_schema(tables, column_map, None, char_budget=len(full)) == full
+    assert _render_full_schema(tables, column_map, None, char_budget=len(full) - 1) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_fetch_schema_context_skips_columns_when_tables_overflow(mock_tenant, mock_user):
+    """Columns are not fetched when the table list alone exceeds the budget."""
+    from apps.agents.graph.base import _schema_context_cache
+    from apps.workspaces.models import SchemaState
+
+    _schema_context_cache.clear()
+
+    mock_ts = MagicMock()
+    mock_ts.id = "ts-large"
+    mock_ts.state = SchemaState.ACTIVE
+
+    tables = [
+        {"name": f"table_{i}", "description": "x" * 80, "row_count": i, "materialized_at": None}
+        for i in range(100)
+    ]
+    describe = AsyncMock(return_value={})
+
+    with (
+        patch("apps.agents.graph.base.TenantSchema") as MockTS,
+        patch("apps.agents.graph.base.get_registry") as mock_registry,
+        patch("apps.agents.graph.base.pipeline_list_tables", new=AsyncMock(return_value=tables)),
+        patch("apps.agents.graph.base.pipeline_describe_tables", new=describe),
+        patch(
+            "apps.transformations.services.lineage.aget_terminal_assets",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        MockTS.objects.filter.return_value.afirst = AsyncMock(return_value=mock_ts)
+        mock_registry.return_value.get.return_value = MagicMock()
+
+        result = await _fetch_schema_context(mock_tenant, mock_user)
+
+    describe.assert_not_awaited()
+    assert "| table_99 |" in result
+    assert "describe_table" in result
@@ -0,0 +1,37 @@
+"""
+factory_boy factories for Scout test data.
+
+Factories only fill in the fields a test doesn't care about; pass ``workspace``
+(and any user FKs) explicitly. Use ``build_batch`` with ``bulk_create`` to seed
+many rows in a single INSERT.
+"""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from apps.knowledge.models import AgentLearning, KnowledgeEntry, TableKnowledge
+
+
+class KnowledgeEntryFactory(DjangoModelFactory):
+    class Meta:
+        model = KnowledgeEntry
+
+    title = factory.Sequence(lambda n: f"Entry {n}")
+    content = factory.LazyAttribute(lambda o: f"Content for {o.title.lower()}")
+    tags = factory.LazyFunction(lambda: ["test"])
+
+
+class TableKnowledgeFactory(DjangoModelFactory):
+    class Meta:
+        model = TableKnowledge
+
+    table_name = factory.Sequence(lambda n: f"table_{n}")
+    description = factory.LazyAttribute(lambda o: f"Table {o.table_name}")
+
+
+class AgentLearningFactory(DjangoModelFactory):
+    class Meta:
+        model = AgentLearning
+
+    description = factory.Sequence(lambda n: f"Learning {n}")
+    applies_to_tables = factory.LazyFunction(lambda: ["orders"])
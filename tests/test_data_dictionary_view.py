@@ -0,0 +1,320 @@
+"""Tests for the pipeline-backed data dictionary endpoint."""
+
+import json
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.knowledge.models import TableKnowledge
+from apps.workspaces.models import MaterializationRun, SchemaState, TenantSchema
+
+
+@pytest.fixture
+def auth_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def tenant_schema(tenant):
+    ts = TenantSchema.objects.create(
+        tenant=tenant, schema_name="dd_schema", state=SchemaState.ACTIVE
+    )
+    MaterializationRun.objects.create(
+        tenant_schema=ts,
+        pipeline="commcare_sync",
+        state=MaterializationRun.RunState.COMPLETED,
+        completed_at=timezone.now(),
+        result={"sources": {"cases": {"rows": 10}, "forms": {"rows": 5}}},
+    )
+    return ts
+
+
+@pytest.mark.django_db
+def test_annotations_loaded_in_single_query(auth_client, workspace, tenant_schema, user):
+    TableKnowledge.objects.create(
+        workspace=workspace,
+        table_name="dd_schema.raw_cases",
+        description="One row per case",
+        use_cases=["Caseload reporting"],
+        updated_by=user,
+    )
+
+    with (
+        patch("apps.workspaces.api.views._get_all_columns", return_value={}),
+        CaptureQueriesContext(connection) as queries,
+    ):
+        resp = auth_client.get(f"/api/workspaces/{workspace.id}/data-dictionary/")
+
+    assert resp.status_code == 200
+    tables = resp.data["tables"]
+    assert tables["dd_schema.raw_cases"]["annotation"]["description"] == "One row per case"
+    assert tables["dd_schema.raw_cases"]["annotation"]["use_cases"] == "Caseload reporting"
+    assert "annotation" not in tables["dd_schema.raw_forms"]
+
+    knowledge_queries = [q for q in queries if TableKnowledge._meta.db_table in q["sql"]]
+    assert len(knowledge_queries) == 1
+
+
+@pytest.mark.django_db
+def test_table_detail_reads_single_legacy_entry(auth_client, workspace, tenant_schema):
+    workspace.data_dictionary = {
+        "tables": {
+            "public.users": {"schema": "public", "name": "users", "columns": []},
+            "public.orders": {"schema": "public", "name": "orders", "columns": []},
+        }
+    }
+    workspace.save(update_fields=["data_dictionary"])
+
+    resp = auth_client.get(f"/api/workspaces/{workspace.id}/data-dictionary/tables/public.users/")
+    missing = auth_client.get(
+        f"/api/workspaces/{workspace.id}/data-dictionary/tables/public.missing/"
+    )
+
+    assert resp.status_code == 200
+    assert resp.data["name"] == "users"
+    assert resp.data["qualified_name"] == "public.users"
+    assert missing.status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "qualified_name",
+    ["public.users;DROP TABLE x", "dd_schema.raw_cases'--", "a.b.c", "1table", "public.us ers"],
+)
+def test_table_detail_unknown_table_name_is_not_found(
+    auth_client, workspace, tenant_schema, qualified_name
+):
+    url = f"/api/workspaces/{workspace.id}/data-dictionary/tables/{qualified_name}/"
+
+    with patch(
+        "apps.workspaces.api.views.pipeline_list_tables", new=AsyncMock(return_value=[])
+    ) as list_tables:
+        assert auth_client.get(url).status_code == 404
+        assert auth_client.put(url, {"description": "x"}, format="json").status_code == 404
+
+    if qualified_name.startswith("dd_schema."):
+        list_tables.assert_awaited()
+
+
+@pytest.mark.django_db
+def test_table_detail_checks_access_before_table_name(workspace, other_user):
+    url = f"/api/workspaces/{workspace.id}/data-dictionary/tables/public.users;DROP TABLE x/"
+    client = APIClient()
+
+    assert client.get(url).status_code in (401, 403)
+    client.force_authenticate(user=other_user)
+    assert client.get(url).status_code == 403
+    assert client.put(url, {"description": "x"}, format="json").status_code == 403
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("qualified_name", ["public.price$usd", "public.MixedCase"])
+def test_table_detail_accepts_any_known_identifier(
+    auth_client, workspace, tenant_schema, qualified_name
+):
+    schema, name = qualified_name.split(".")
+    workspace.data_dictionary = {"tables": {qualified_name: {"schema": schema, "name": name}}}
+    workspace.save(update_fields=["data_dictionary"])
+    url = f"/api/workspaces/{workspace.id}/data-dictionary/tables/{qualified_name}/"
+
+    resp = auth_client.get(url)
+
+    assert resp.status_code == 200
+    assert resp.data["qualified_name"] == qualified_name
+
+
+def test_orjson_renderer_matches_drf_output():
+    from decimal import Decimal
+
+    from django.utils.translation import gettext_lazy
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.workspaces.api.renderers import ORJSONRenderer
+
+    data = {"tables": {"s.t": {"columns": [{"name": "id", "default": None}]}}, "n": Decimal("1.5")}
+    data["error"] = gettext_lazy("Table not found.")
+
+    assert json.loads(ORJSONRenderer().render(data)) == json.loads(JSONRenderer().render(data))
+    assert ORJSONRenderer().render(None) == b""
+
+
+@pytest.mark.parametrize(
+    ("data", "renderer_context"),
+    [
+        ({"generated_at": datetime(2026, 3, 2, 10, 0, 0, 123456, tzinfo=UTC)}, None),
+        ({"at": datetime(2026, 3, 2, 10), "on": date(2026, 3, 2)}, None),
+        ({"row_count": 2**70}, None),
+        ({"note": "line\u2028break"}, None),
+        ({"generated_at": datetime(2026, 3, 2, tzinfo=UTC)}, {"indent": 4}),
+    ],
+)
+def test_orjson_renderer_is_byte_identical_to_drf(data, renderer_context):
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.workspaces.api.renderers import ORJSONRenderer
+
+    assert ORJSONRenderer().render(data, renderer_context=renderer_context) == (
+        JSONRenderer().render(data, renderer_context=renderer_context)
+    )
+
+
+@pytest.mark.parametrize("view_name", ["DataDictionaryView", "TableDetailView"])
+def test_data_dictionary_views_keep_default_renderers(view_name):
+    from rest_framework.renderers import BrowsableAPIRenderer
+
+    from apps.workspaces.api import views
+    from apps.workspaces.api.renderers import ORJSONRenderer
+
+    renderers = getattr(views, view_name).renderer_classes
+    assert renderers[0] is ORJSONRenderer
+    assert BrowsableAPIRenderer in renderers
+
+
+@pytest.mark.django_db
+def test_empty_dictionary_before_first_materialization(auth_client, workspace, tenant):
+    TenantSchema.objects.create(tenant=tenant, schema_name="dd_empty", state=SchemaState.ACTIVE)
+
+    with patch("apps.workspaces.api.views.pipeline_list_tables") as list_tables:
+        resp = auth_client.get(f"/api/workspaces/{workspace.id}/data-dictionary/")
+
+    assert resp.status_code == 200
+    assert resp.data == {"tables": {}, "generated_at": None}
+    list_tables.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_data_dictionary_awaits_async_table_listing(auth_client, workspace, tenant_schema):
+    """pipeline_list_tables is a coroutine function; the sync views must run it to completion."""
+    from mcp_server.services.metadata import pipeline_list_tables
+
+    list_tables = AsyncMock(wraps=pipeline_list_tables)
+
+    with (
+        patch("apps.workspaces.api.views.pipeline_list_tables", new=list_tables),
+        patch("apps.workspaces.api.views._get_all_columns", return_value={}),
+        patch("apps.workspaces.api.views._get_table_columns", return_value=[]),
+    ):
+        listing = auth_client.get(f"/api/workspaces/{workspace.id}/data-dictionary/")
+        detail = auth_client.get(
+            f"/api/workspaces/{workspace.id}/data-dictionary/tables/dd_schema.raw_cases/"
+        )
+
+    assert listing.status_code == 200
+    assert "dd_schema.raw_cases" in listing.data["tables"]
+    assert detail.status_code == 200
+    assert detail.data["name"] == "raw_cases"
+    assert list_tables.await_count == 2
+
+
+@pytest.mark.django_db
+def test_columns_cached_per_materialization_run(auth_client, workspace, tenant_schema):
+    from django.core.cache import cache
+
+    cache.clear()
+    columns = {"raw_cases": [{"name": "case_id", "data_type": "text"}]}
+    url = f"/api/workspaces/{workspace.id}/data-dictionary/"
+
+    with patch("apps.workspaces.api.views._get_all_columns", return_value=columns) as get_cols:
+        first = auth_client.get(url)
+        second = auth_client.get(url)
+        MaterializationRun.objects.create(
+            tenant_schema=tenant_schema,
+            pipeline="commcare_sync",
+            state=MaterializationRun.RunState.COMPLETED,
+            completed_at=timezone.now(),
+            result={"sources": {"cases": {"rows": 11}}},
+        )
+        third = auth_client.get(url)
+
+    assert first.data == second.data
+    assert first.data["tables"]["dd_schema.raw_cases"]["columns"] == columns["raw_cases"]
+    assert third.status_code == 200
+    assert get_cols.call_count == 2
+
+
+@pytest.mark.django_db
+def test_columns_cache_invalidated_by_transformation_run(auth_client, workspace, tenant_schema):
+    from django.core.cache import cache
+
+    from apps.transformations.models import TransformationRun, TransformationRunStatus
+
+    cache.clear()
+    url = f"/api/workspaces/{workspace.id}/data-dictionary/"
+
+    columns = {"raw_cases": [{"name": "case_id", "data_type": "text"}]}
+
+    with patch("apps.workspaces.api.views._get_all_columns", return_value=columns) as get_cols:
+        auth_client.get(url)
+        run = TransformationRun.objects.create(
+            tenant=tenant_schema.tenant, status=TransformationRunStatus.RUNNING
+        )
+        auth_client.get(url)
+        assert get_cols.call_count == 1
+
+        run.status = TransformationRunStatus.COMPLETED
+        run.completed_at = timezone.now()
+        run.save(update_fields=["status", "completed_at"])
+        auth_client.get(url)
+
+    assert get_cols.call_count == 2
+
+
+@pytest.mark.django_db
+class TestTableAnnotationPut:
+    @pytest.fixture
+    def url(self, workspace, tenant_schema):
+        workspace.data_dictionary = {"tables": {"public.users": {"name": "users"}}}
+        workspace.save(update_fields=["data_dictionary"])
+        return f"/api/workspaces/{workspace.id}/data-dictionary/tables/public.users/"
+
+    def test_saves_annotation_and_ignores_unknown_fields(self, auth_client, url):
+        payload = {
+            "description": "App users",
+            "use_cases": "Signups\nChurn",
+            "related_tables": "public.orders, public.events",
+            "column_notes": {"email": "Lowercased"},
+            "unexpected": 1,
+        }
+        resp = auth_client.put(url, payload, format="json")
+
+        assert resp.status_code == 200
+        assert resp.data["use_cases"] == "Signups\nChurn"
+        assert resp.data["related_tables"] == ["public.orders", "public.events"]
+        assert resp.data["column_notes"] == {"email": "Lowercased"}
+        assert "unexpected" not in resp.data
+
+    def test_null_fields_clear_existing_annotation(self, auth_client, url):
+        auth_client.put(
+            url,
+            {"description": "App users", "owner": "Data team", "column_notes": {"id": "PK"}},
+            format="json",
+        )
+        payload = dict.fromkeys(
+            ("description", "owner", "use_cases", "related_tables", "column_notes")
+        )
+        resp = auth_client.put(url, payload, format="json")
+
+        assert resp.status_code == 200
+        tk = TableKnowledge.objects.get()
+        assert tk.description == ""
+        assert tk.owner == ""
+        assert tk.use_cases == []
+        assert tk.related_tables == []
+        assert tk.column_notes == {}
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{"description": 5}, {"column_notes": ["email"]}, {"use_cases": {"a": 1}}],
+    )
+    def test_rejects_wrong_field_types(self, auth_client, url, payload):
+        resp = auth_client.put(url, payload, format="json")
+
+        assert resp.status_code == 400
+        assert not TableKnowledge.objects.exists()
@@ -60,7 +60,7 @@ class TestRunDbt:
         mock_runner = MagicMock()
         mock_runner.invoke.return_value = mock_result
 
-        with patch("mcp_server.services.dbt_runner.dbtRunner", return_value=mock_runner):
+        with patch("mcp_server.services.dbt_runner._dbt_runner", return_value=mock_runner):
             result = run_dbt(
                 dbt_project_dir=str(tmp_path),
                 profiles_dir=str(tmp_path),
@@ -82,7 +82,7 @@ class TestRunDbt:
         mock_runner = MagicMock()
         mock_runner.invoke.return_value = mock_result
 
-        with patch("mcp_server.services.dbt_runner.dbtRunner", return_value=mock_runner):
+        with patch("mcp_server.services.dbt_runner._dbt_runner", return_value=mock_runner):
             result = run_dbt(
                 dbt_project_dir=str(tmp_path),
                 profiles_dir=str(tmp_path),
@@ -102,7 +102,7 @@ class TestRunDbt:
         mock_runner = MagicMock()
         mock_runner.invoke.return_value = mock_result
 
-        with patch("mcp_server.services.dbt_runner.dbtRunner", return_value=mock_runner):
+        with patch("mcp_server.services.dbt_runner._dbt_runner", return_value=mock_runner):
             run_dbt(
                 dbt_project_dir="/path/to/project",
                 profiles_dir="/path/to/profiles",
@@ -135,7 +135,16 @@ class TestRunDbt:
 
         mock_runner.invoke.side_effect = invoke_side_effect
 
-        with patch("mcp_server.services.dbt_runner.dbtRunner", return_value=mock_runner):
+        with patch("mcp_server.services.dbt_runner._dbt_runner", return_value=mock_runner):
             run_dbt(str(tmp_path), str(tmp_path), ["stg_cases"])
 
         assert lock_was_held == [True]
+
+
+def test_import_does_not_load_dbt():
+    """dbt is imported on first run, not when the module (and the views using it) load."""
+    import subprocess
+    import sys
+
+    code = "import sys, mcp_server.services.dbt_runner; sys.exit('dbt.cli.main' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
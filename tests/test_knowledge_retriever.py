@@ -8,9 +8,15 @@ Tests cover:
 - Agent learnings
 - Full assembly with all knowledge types
 - Retrieval filtering and prioritization
+
+Tests call the async retriever through async_to_sync. That runs the async ORM on
+the test thread, inside the test's rolled-back transaction, so the retriever sees
+rows the test created and its queries count on the test connection. These tests
+need neither transaction=True nor the table flush it costs after every test.
 """
 
 import pytest
+from asgiref.sync import async_to_sync
 
 from apps.knowledge.models import (
     AgentLearning,
@@ -18,103 +24,87 @@ from apps.knowledge.models import (
     TableKnowledge,
 )
 from apps.knowledge.services.retriever import KnowledgeRetriever
+from apps.workspaces.models import Workspace
+from tests.factories import AgentLearningFactory, KnowledgeEntryFactory, TableKnowledgeFactory
+
+
+@pytest.fixture
+def retrieve(workspace):
+    """KnowledgeRetriever(workspace).retrieve as a sync callable."""
+    return async_to_sync(KnowledgeRetriever(workspace).retrieve)
+
+
+@pytest.mark.django_db
+def test_retriever_initialization(workspace):
+    retriever = KnowledgeRetriever(workspace)
+    assert retriever.workspace == workspace
+    assert hasattr(retriever, "retrieve")
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestEmptyKnowledge:
     """Test retriever behavior with no knowledge."""
 
-    @pytest.mark.asyncio
-    async def test_empty_knowledge_returns_valid_string(self, workspace):
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-        assert isinstance(result, str)
-        assert len(result) >= 0
+    def test_empty_knowledge_has_no_sections(self, retrieve):
+        assert retrieve() == ""
 
-    @pytest.mark.asyncio
-    async def test_empty_knowledge_has_no_sections(self, workspace):
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-        # No headers when empty
-        assert "##" not in result
+    def test_other_workspaces_knowledge_is_ignored(self, user, retrieve):
+        other = Workspace.objects.create(name="Other", created_by=user)
+        KnowledgeEntryFactory(workspace=other, created_by=user)
+        TableKnowledgeFactory(workspace=other, updated_by=user)
+        AgentLearningFactory(workspace=other, discovered_by_user=user)
 
+        assert retrieve() == ""
 
-@pytest.mark.django_db(transaction=True)
+
+@pytest.mark.django_db
 class TestKnowledgeEntries:
     """Test retriever with knowledge entries."""
 
-    @pytest.mark.asyncio
-    async def test_single_entry(self, workspace, user):
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="MRR",
-            content="Monthly Recurring Revenue from active subscriptions\n\n```sql\nSELECT SUM(amount) FROM subscriptions WHERE status = 'active'\n```",
-            tags=["metric"],
-            created_by=user,
+    def test_entries_rendered(self, workspace, user, retrieve):
+        KnowledgeEntry.objects.bulk_create(
+            KnowledgeEntry(workspace=workspace, created_by=user, **fields)
+            for fields in (
+                {
+                    "title": "MRR",
+                    "content": "Monthly Recurring Revenue from active subscriptions\n\n```sql\nSELECT SUM(amount) FROM subscriptions WHERE status = 'active'\n```",
+                    "tags": ["metric"],
+                },
+                {
+                    "title": "Soft Delete Rule",
+                    "content": "Always filter deleted_at IS NULL for active records",
+                    "tags": ["rule"],
+                },
+                {
+                    "title": "Daily Revenue Query",
+                    "content": "```sql\nSELECT DATE(created_at), SUM(amount) FROM orders GROUP BY 1\n```",
+                    "tags": ["query"],
+                },
+                {
+                    "title": "Revenue excludes cancelled orders",
+                    "content": "When calculating revenue, always exclude orders with status 'cancelled' or 'refunded'.",
+                    "tags": ["rule", "finance"],
+                },
+            )
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
         assert "MRR" in result
         assert "Monthly Recurring Revenue" in result
         assert "SUM(amount)" in result
-
-    @pytest.mark.asyncio
-    async def test_multiple_entries(self, workspace, user):
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="MRR",
-            content="Monthly Recurring Revenue",
-            tags=["metric"],
-            created_by=user,
-        )
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="Soft Delete Rule",
-            content="Always filter deleted_at IS NULL for active records",
-            tags=["rule"],
-            created_by=user,
-        )
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="Daily Revenue Query",
-            content="```sql\nSELECT DATE(created_at), SUM(amount) FROM orders GROUP BY 1\n```",
-            tags=["query"],
-            created_by=user,
-        )
-
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-
-        assert "MRR" in result
         assert "Soft Delete Rule" in result
         assert "Daily Revenue Query" in result
-
-    @pytest.mark.asyncio
-    async def test_entry_content_appears(self, workspace, user):
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="Revenue excludes cancelled orders",
-            content="When calculating revenue, always exclude orders with status 'cancelled' or 'refunded'.",
-            tags=["rule", "finance"],
-            created_by=user,
-        )
-
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-
         assert "Revenue excludes cancelled orders" in result
-        assert "cancelled" in result
+        assert "'cancelled' or 'refunded'" in result
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestTableKnowledge:
     """Test retriever with table knowledge."""
 
-    @pytest.mark.asyncio
-    async def test_single_table_knowledge(self, workspace, user):
-        await TableKnowledge.objects.acreate(
+    def test_single_table_knowledge(self, workspace, user, retrieve):
+        TableKnowledge.objects.create(
             workspace=workspace,
             table_name="orders",
             description="Customer orders with payment and fulfillment status",
@@ -126,32 +116,34 @@ class TestTableKnowledge:
             updated_by=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        assert "orders" in result.lower()
-        assert "Customer orders" in result or "orders" in result.lower()
+        assert "### orders\n" in result
+        assert "Customer orders with payment and fulfillment status" in result
+        assert "- `status`: Values: pending, completed, cancelled" in result
+        assert "- amount is in cents" in result
+        assert "**Refresh Frequency:** real-time" in result
 
-    @pytest.mark.asyncio
-    async def test_multiple_table_knowledge(self, workspace, user):
-        for i in range(10):
-            await TableKnowledge.objects.acreate(
+    @pytest.mark.parametrize("count", [2, 10])
+    def test_multiple_table_knowledge(self, workspace, user, count, retrieve):
+        TableKnowledge.objects.bulk_create(
+            TableKnowledge(
                 workspace=workspace,
                 table_name=f"table_{i}",
                 description=f"Test table {i}",
                 use_cases=[f"Use case {i}"],
                 updated_by=user,
             )
+            for i in range(count)
+        )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        for i in range(10):
-            assert f"table_{i}" in result.lower()
+        headings = [line[4:] for line in result.splitlines() if line.startswith("### ")]
+        assert headings == sorted(f"table_{i}" for i in range(count))
 
-    @pytest.mark.asyncio
-    async def test_table_with_related_tables(self, workspace, user):
-        await TableKnowledge.objects.acreate(
+    def test_table_with_related_tables(self, workspace, user, retrieve):
+        TableKnowledge.objects.create(
             workspace=workspace,
             table_name="orders",
             description="Customer orders",
@@ -162,21 +154,20 @@ class TestTableKnowledge:
             updated_by=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        assert "orders" in result.lower()
-        if "users" in result:
-            assert "related" in result.lower() or "user_id" in result
+        assert "### orders\n" in result
+        assert "**Related Tables:**" in result
+        assert "- `users`: `orders.user_id = users.id`" in result
+        assert "- `products`: `orders.product_id = products.id`" in result
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestAgentLearnings:
     """Test retriever with agent learnings."""
 
-    @pytest.mark.asyncio
-    async def test_single_learning(self, workspace, user):
-        await AgentLearning.objects.acreate(
+    def test_single_learning(self, workspace, user, retrieve):
+        AgentLearning.objects.create(
             workspace=workspace,
             description="Amount column is in cents, not dollars. Divide by 100.",
             category="type_mismatch",
@@ -189,52 +180,39 @@ class TestAgentLearnings:
             discovered_by_user=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        assert "cents" in result.lower() or "divide by 100" in result.lower()
+        assert "- Amount column is in cents, not dollars. Divide by 100." in result
 
-    @pytest.mark.asyncio
-    async def test_multiple_learnings_ordered_by_confidence(self, workspace, user):
-        await AgentLearning.objects.acreate(
-            workspace=workspace,
-            description="Low confidence learning",
-            category="other",
-            applies_to_tables=["table1"],
-            confidence_score=0.3,
-            is_active=True,
-            discovered_by_user=user,
-        )
-        await AgentLearning.objects.acreate(
-            workspace=workspace,
-            description="High confidence learning",
-            category="other",
-            applies_to_tables=["table2"],
-            confidence_score=0.9,
-            is_active=True,
-            discovered_by_user=user,
-        )
-        await AgentLearning.objects.acreate(
-            workspace=workspace,
-            description="Medium confidence learning",
-            category="other",
-            applies_to_tables=["table3"],
-            confidence_score=0.6,
-            is_active=True,
-            discovered_by_user=user,
+    def test_multiple_learnings_ordered_by_confidence(self, workspace, user, retrieve):
+        AgentLearning.objects.bulk_create(
+            AgentLearning(
+                workspace=workspace,
+                description=f"{label} confidence learning",
+                category="other",
+                applies_to_tables=[table],
+                confidence_score=score,
+                is_active=True,
+                discovered_by_user=user,
+            )
+            for label, table, score in (
+                ("Low", "table1", 0.3),
+                ("High", "table2", 0.9),
+                ("Medium", "table3", 0.6),
+            )
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        if "High confidence" in result and "Low confidence" in result:
-            high_pos = result.index("High confidence")
-            low_pos = result.index("Low confidence")
-            assert high_pos < low_pos
+        bullets = [line[2:] for line in result.splitlines() if line.startswith("- ")]
+        assert bullets == [
+            "High confidence learning",
+            "Medium confidence learning",
+            "Low confidence learning",
+        ]
 
-    @pytest.mark.asyncio
-    async def test_inactive_learnings_excluded(self, workspace, user):
-        await AgentLearning.objects.acreate(
+    def test_inactive_learnings_excluded(self, workspace, user, retrieve):
+        AgentLearning.objects.create(
             workspace=workspace,
             description="Active learning",
             category="other",
@@ -242,7 +220,7 @@ class TestAgentLearnings:
             is_active=True,
             discovered_by_user=user,
         )
-        await AgentLearning.objects.acreate(
+        AgentLearning.objects.create(
             workspace=workspace,
             description="Inactive learning",
             category="other",
@@ -251,15 +229,13 @@ class TestAgentLearnings:
             discovered_by_user=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
         assert "Active learning" in result
         assert "Inactive learning" not in result
 
-    @pytest.mark.asyncio
-    async def test_learning_with_evidence(self, workspace, user):
-        await AgentLearning.objects.acreate(
+    def test_learning_with_evidence(self, workspace, user, retrieve):
+        AgentLearning.objects.create(
             workspace=workspace,
             description="Status column uses codes not names",
             category="naming",
@@ -272,43 +248,38 @@ class TestAgentLearnings:
             discovered_by_user=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        assert "status" in result.lower()
+        assert "- Status column uses codes not names\n  - *Tables: `orders`*" in result
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestFullAssembly:
     """Test retriever with all knowledge types together."""
 
-    @pytest.mark.asyncio
-    async def test_all_knowledge_types_present(self, workspace, user):
-        await KnowledgeEntry.objects.acreate(
+    def test_all_knowledge_types_present(self, workspace, user, retrieve):
+        KnowledgeEntry.objects.create(
             workspace=workspace,
             title="MRR",
             content="Monthly Recurring Revenue\n\n```sql\nSELECT SUM(amount) FROM subscriptions WHERE status = 'active'\n```",
             tags=["metric"],
             created_by=user,
         )
-
-        await KnowledgeEntry.objects.acreate(
+        KnowledgeEntry.objects.create(
             workspace=workspace,
             title="Soft Delete Rule",
             content="Always filter deleted_at IS NULL",
             tags=["rule"],
             created_by=user,
         )
-
-        await TableKnowledge.objects.acreate(
+        TableKnowledge.objects.create(
             workspace=workspace,
             table_name="orders",
             description="Customer orders",
             use_cases=["Revenue reporting"],
             updated_by=user,
         )
-
-        await AgentLearning.objects.acreate(
+        AgentLearning.objects.create(
             workspace=workspace,
             description="Amount is in cents",
             category="type_mismatch",
@@ -317,84 +288,83 @@ class TestFullAssembly:
             discovered_by_user=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
+        assert result.startswith("## Knowledge Base\n")
         assert "MRR" in result
-        assert "Soft Delete" in result or "deleted_at" in result
-        assert "orders" in result.lower()
-        assert "cents" in result.lower()
-
-    @pytest.mark.asyncio
-    async def test_knowledge_sections_clearly_separated(self, workspace, user):
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="MRR",
-            content="Monthly Recurring Revenue\n\n```sql\nSELECT SUM(amount) FROM subscriptions\n```",
-            tags=["metric"],
-            created_by=user,
+        assert "### Soft Delete Rule\n" in result
+        assert "### orders" in result
+        assert "Amount is in cents" in result
+        # Each knowledge type gets its own section, separated by a blank line.
+        assert "\n\n## Table Context (beyond schema)\n" in result
+        assert "\n\n## Learned Corrections\n" in result
+
+
+@pytest.mark.django_db
+class TestLargeKnowledgeBase:
+    """Test retriever with many rows of each knowledge type."""
+
+    @pytest.mark.parametrize("n", [1, 5, 20])
+    def test_large_knowledge_base(self, workspace, user, n, retrieve):
+        entries = KnowledgeEntry.objects.bulk_create(
+            KnowledgeEntryFactory.build_batch(n, workspace=workspace, created_by=user)
         )
-
-        await KnowledgeEntry.objects.acreate(
-            workspace=workspace,
-            title="Test Rule",
-            content="Test description",
-            tags=["rule"],
-            created_by=user,
+        tables = TableKnowledge.objects.bulk_create(
+            TableKnowledgeFactory.build_batch(n, workspace=workspace, updated_by=user)
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        result = retrieve()
 
-        assert len(result) > 0
-        assert isinstance(result, str)
+        for entry in entries:
+            assert f"### {entry.title}\n" in result
+        for table in tables:
+            assert f"### {table.table_name}\n" in result
 
-    @pytest.mark.asyncio
-    async def test_knowledge_context_is_string(self, workspace):
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-        assert isinstance(result, str)
 
-    @pytest.mark.asyncio
-    async def test_large_knowledge_base(self, workspace, user):
-        for i in range(20):
-            await KnowledgeEntry.objects.acreate(
-                workspace=workspace,
-                title=f"Entry {i}",
-                content=f"Content for entry {i}",
-                tags=["test"],
-                created_by=user,
-            )
+@pytest.mark.django_db
+class TestQueryCount:
+    """The retriever issues one query per knowledge type, however many rows exist."""
 
-        for i in range(20):
-            await TableKnowledge.objects.acreate(
+    @pytest.mark.parametrize("n", [1, 20])
+    def test_retrieve_is_constant_queries(
+        self, workspace, user, n, django_assert_num_queries, retrieve
+    ):
+        entries = KnowledgeEntry.objects.bulk_create(
+            KnowledgeEntryFactory.build_batch(n, workspace=workspace, created_by=user)
+        )
+        tables = TableKnowledge.objects.bulk_create(
+            TableKnowledgeFactory.build_batch(
+                n,
                 workspace=workspace,
-                table_name=f"table_{i}",
-                description=f"Table {i}",
+                related_tables=[{"table": "users", "join_hint": "user_id"}],
                 updated_by=user,
             )
+        )
+        learnings = AgentLearning.objects.bulk_create(
+            AgentLearningFactory.build_batch(n, workspace=workspace, discovered_by_user=user)
+        )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
+        with django_assert_num_queries(3):
+            result = retrieve()
 
-        assert isinstance(result, str)
-        assert len(result) > 0
+        assert f"### {entries[-1].title}" in result
+        assert f"### {tables[-1].table_name}" in result
+        assert f"- {learnings[-1].description}" in result
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestRetrievalFiltering:
     """Test knowledge filtering and prioritization."""
 
-    @pytest.mark.asyncio
-    async def test_question_based_table_filtering(self, workspace, user):
-        await TableKnowledge.objects.acreate(
+    def test_question_based_table_filtering(self, workspace, user, retrieve):
+        TableKnowledge.objects.create(
             workspace=workspace,
             table_name="users",
             description="User accounts and profiles",
             use_cases=["User analysis", "Authentication"],
             updated_by=user,
         )
-        await TableKnowledge.objects.acreate(
+        TableKnowledge.objects.create(
             workspace=workspace,
             table_name="orders",
             description="Customer orders and purchases",
@@ -402,19 +372,7 @@ class TestRetrievalFiltering:
             updated_by=user,
         )
 
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve(user_question="What is the total revenue?")
-
-        if await TableKnowledge.objects.filter(workspace=workspace).acount() > 1:
-            assert "orders" in result.lower()
-
-    def test_retriever_initialization(self, workspace):
-        retriever = KnowledgeRetriever(workspace)
-        assert retriever.workspace == workspace
-        assert hasattr(retriever, "retrieve")
+        result = retrieve(user_question="What is the total revenue?")
 
-    @pytest.mark.asyncio
-    async def test_empty_workspace_knowledge(self, workspace):
-        retriever = KnowledgeRetriever(workspace)
-        result = await retriever.retrieve()
-        assert isinstance(result, str)
+        assert "### orders\n" in result
+        assert "### users\n" in result
@@ -18,3 +18,24 @@ def test_cannot_manually_create_agent_learning(api_client, workspace):
     resp = api_client.post(url, {"type": "learning", "description": "test"})
     assert resp.status_code == status.HTTP_400_BAD_REQUEST
     assert "AgentLearning" in resp.data["error"]
+
+
+def test_list_fetches_entry_creators_with_entries(api_client, workspace, user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from apps.knowledge.models import KnowledgeEntry
+
+    KnowledgeEntry.objects.bulk_create(
+        KnowledgeEntry(workspace=workspace, title=f"Entry {i}", content="c", created_by=user)
+        for i in range(5)
+    )
+    url = reverse("knowledge:list_create", kwargs={"workspace_id": workspace.id})
+
+    with CaptureQueriesContext(connection) as queries:
+        resp = api_client.get(url, {"type": "entry"})
+
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(resp.data["results"]) == 5
+    user_table = user._meta.db_table
+    assert [q for q in queries if f'FROM "{user_table}"' in q["sql"]] == []
@@ -320,6 +320,41 @@ async def test_transformation_aware_terminal_replaces_raw(tenant):
     assert "raw_forms" in names
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_transformation_aware_excludes_whole_replaces_chain(tenant):
+    """Every table up a multi-step replaces chain is hidden behind the terminal asset."""
+    from mcp_server.services.metadata import transformation_aware_list_tables
+
+    upstream = None
+    for name in ("stg_a", "int_b", "final_c"):
+        upstream = await sync_to_async(TransformationAsset.objects.create)(
+            name=name,
+            scope=TransformationScope.TENANT,
+            tenant=tenant,
+            sql_content="SELECT 1",
+            replaces=upstream,
+        )
+
+    mock_raw_tables = [
+        {"name": "stg_a", "type": "table", "description": "", "row_count": 1},
+        {"name": "int_b", "type": "table", "description": "", "row_count": 1},
+        {"name": "raw_forms", "type": "table", "description": "", "row_count": 1},
+    ]
+
+    with patch(
+        "mcp_server.services.metadata.pipeline_list_tables",
+        new=AsyncMock(return_value=mock_raw_tables),
+    ):
+        result = await transformation_aware_list_tables(
+            tenant_schema=None,
+            pipeline_config=None,
+            tenant_ids=[tenant.id],
+        )
+
+    assert {t["name"] for t in result} == {"raw_forms", "final_c"}
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db(transaction=True)
 async def test_transformation_aware_mixed(tenant):
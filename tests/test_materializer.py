@@ -254,6 +254,21 @@ class TestRunPipeline:
         assert run.state == "failed"
 
 
+class TestJsonDumps:
+    def test_matches_stdlib_json(self):
+        import json
+
+        from mcp_server.services.materializer import _json_dumps
+
+        value = {"name": "Zoë", 1: [True, None, 1.5], "nested": {"ids": ["a", "b"]}}
+        assert json.loads(_json_dumps(value)) == json.loads(json.dumps(value))
+
+    def test_falls_back_for_big_integers(self):
+        from mcp_server.services.materializer import _json_dumps
+
+        assert _json_dumps({"n": 2**70}) == '{"n": 1180591620717411303424}'
+
+
 @pytest.mark.django_db
 class TestWriteCases:
     """Real DB tests for _write_cases using psycopg."""
@@ -297,9 +312,10 @@ class TestWriteCases:
             conn.commit()
             assert count == 1
             with conn.cursor() as cur:
-                cur.execute(f"SELECT case_id FROM {test_schema}.raw_cases")
+                cur.execute(f"SELECT case_id, properties FROM {test_schema}.raw_cases")
                 rows = cur.fetchall()
             assert rows[0][0] == "c1"
+            assert rows[0][1] == {"name": "Alice"}
         finally:
             conn.rollback()  # end any open transaction before switching autocommit
             conn.autocommit = True
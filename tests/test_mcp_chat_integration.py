@@ -8,54 +8,97 @@ Mocking strategy:
 - ChatAnthropic: mocked to control tool calls and text responses
 - MCP server: mocked via get_mcp_tools() returning fake LangChain tools
 - Checkpointer: uses MemorySaver (no PostgreSQL needed)
-- Django ORM: real test DB with fixtures
+- Django ORM: real test DB with fixtures; endpoint tests drive the async view through
+  async_to_sync so it runs inside each test's rolled-back transaction
 """
 
+import asyncio
 import json
+import re
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from importlib import import_module
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
+import orjson
 import pytest
-from django.contrib.auth.signals import user_logged_in
-from django.test import AsyncClient
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.test import AsyncClient, override_settings
 from langchain_core.messages import ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
 
+from apps.agents.graph.base import _build_tools
+from apps.chat.models import Thread
 from apps.chat.stream import _sse, _tool_content_to_str, langgraph_to_ui_stream
+from apps.workspaces.models import Workspace
+
+# Stream chunks only need a .content attribute; a MagicMock per chunk is needless overhead.
+_chunk = SimpleNamespace
+
+
+@dataclass(slots=True)
+class _StubTool:
+    """Stand-in for an MCP LangChain tool; the agent only reads its name."""
+
+    name: str
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module", autouse=True)
+def _signed_cookie_sessions():
+    """Keep login sessions in a signed cookie rather than a database row.
+
+    Module-scoped so the setting is in place before the shared client's session
+    middleware reads it.
+    """
+    with override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies"):
+        yield
+
+
+@pytest.fixture(scope="module")
 def async_client():
-    """Django async test client."""
+    """Django async test client, shared across the module so its handler loads middleware once."""
     return AsyncClient()
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_cookies(async_client):
+    """Log the shared client out after each test."""
+    yield
+    async_client.cookies.clear()
+
+
 @pytest.fixture
 def auth_async_client(async_client, user):
     """Authenticated async test client.
 
-    Uses sync force_login with the update_last_login signal disconnected
-    to avoid async transaction isolation issues.
+    Writes the login session directly instead of calling force_login, so the
+    user_logged_in signal (and update_last_login's cross-transaction save) never fires.
     """
-    # Disconnect update_last_login signal to avoid cross-transaction save
-    from django.contrib.auth.models import update_last_login
-
-    user_logged_in.disconnect(update_last_login)
-    try:
-        async_client.force_login(user)
-    finally:
-        user_logged_in.connect(update_last_login)
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    async_client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
     return async_client
 
 
 @pytest.fixture
 def workspace_from_membership(tenant_membership):
     """Return the Workspace auto-created for the tenant_membership."""
-    from apps.workspaces.models import Workspace
-
     return Workspace.objects.get(
         is_auto_created=True,
         workspace_tenants__tenant=tenant_membership.tenant,
@@ -63,6 +106,47 @@ def workspace_from_membership(tenant_membership):
     )
 
 
+@pytest.fixture(scope="module")
+def memory_saver():
+    """One in-memory checkpointer for the module; the agents that would use it are stubbed."""
+    return MemorySaver()
+
+
+@pytest.fixture
+def chat_body(workspace_from_membership):
+    """The default chat request for the member's workspace, serialized once."""
+    return orjson.dumps(_chat_body(workspace_from_membership.id))
+
+
+@pytest.fixture
+def sse_events(monkeypatch):
+    """Events langgraph_to_ui_stream emits, captured before SSE encoding.
+
+    Skips the json.dumps and re-parse of every event in stream-level tests; the
+    encoding itself is covered by test_sse_format_correct and the endpoint tests.
+    """
+    events = []
+    monkeypatch.setattr("apps.chat.stream._sse", lambda chunk: events.append(chunk) or "")
+    return events
+
+
+@pytest.fixture
+def chat_views(monkeypatch, memory_saver):
+    """Stub the chat view's MCP tool loading, checkpointer and agent graph builder.
+
+    MCP tools default to none and the checkpointer to a MemorySaver; tests set
+    build_agent_graph's return value or side effect.
+    """
+    stubs = SimpleNamespace(
+        get_mcp_tools=AsyncMock(return_value=[]),
+        ensure_checkpointer=AsyncMock(return_value=memory_saver),
+        build_agent_graph=AsyncMock(),
+    )
+    for name, stub in vars(stubs).items():
+        monkeypatch.setattr(f"apps.chat.views.{name}", stub)
+    return stubs
+
+
 def _chat_body(workspace_id, message="What tables are available?", thread_id=None):
     """Build a chat request body."""
     body = {
@@ -87,191 +171,137 @@ def _chat_body_v6(workspace_id, message="What tables are available?"):
     }
 
 
-async def _collect_sse_events(response):
-    """Collect SSE events from a StreamingHttpResponse."""
-    events = []
-    async for chunk in response.streaming_content:
-        text = chunk if isinstance(chunk, str) else chunk.decode("utf-8")
-        for line in text.strip().split("\n"):
-            line = line.strip()
-            if line.startswith("data: "):
-                try:
-                    events.append(json.loads(line[6:]))
-                except json.JSONDecodeError:
-                    pass
-    return events
+_SSE_DATA = re.compile(rb"^data: (.+)$", re.MULTILINE)
 
 
-# ---------------------------------------------------------------------------
-# Layer 1: Chat Endpoint Validation
-# ---------------------------------------------------------------------------
+async def _collect_sse(stream):
+    """Collect the JSON payload of every SSE data line an event stream yields."""
+    body = b"".join([c if isinstance(c, bytes) else c.encode() async for c in stream])
+    return [orjson.loads(data) for data in _SSE_DATA.findall(body)]
 
 
-class TestChatEndpointValidation:
-    """Test request validation in the chat view."""
+async def _drain(stream):
+    """Run an event stream to completion, discarding what it yields."""
+    async for _ in stream:
+        pass
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_unauthenticated_returns_401(self, async_client, workspace_from_membership):
-        """Unauthenticated requests should return 401."""
-        response = await async_client.post(
-            "/api/chat/",
-            data=json.dumps(_chat_body(workspace_from_membership.id)),
-            content_type="application/json",
-        )
-        assert response.status_code == 401
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_get_method_returns_405(self, auth_async_client, tenant_membership):
-        """GET requests should return 405."""
-        response = await auth_async_client.get("/api/chat/")
-        assert response.status_code == 405
+def _post_chat(client, body, *, parse_events=True):
+    """POST a chat request from a sync test; return the response and its SSE events.
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_missing_messages_returns_400(self, auth_async_client, workspace_from_membership):
-        """Missing messages field should return 400."""
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps({"data": {"workspaceId": str(workspace_from_membership.id)}}),
-            content_type="application/json",
-        )
-        assert response.status_code == 400
-        body = json.loads(response.content)
-        assert "messages" in body["error"].lower()
+    async_to_sync runs the async view on the test thread, so its ORM calls share the
+    test's rolled-back transaction and the tests need no transaction=True flush.
+    A streamed response is always run to completion; events are None for
+    non-streaming (error) responses or when parse_events is False.
+    """
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_missing_tenant_id_returns_400(self, auth_async_client):
-        """Missing workspaceId should return 400."""
-        response = await auth_async_client.post(
+    async def post():
+        response = await client.post(
             "/api/chat/",
-            data=json.dumps({"messages": [{"content": "hello"}]}),
+            data=body if isinstance(body, str | bytes) else orjson.dumps(body),
             content_type="application/json",
         )
-        assert response.status_code == 400
-        body = json.loads(response.content)
-        assert "workspaceId" in body["error"]
+        if not response.streaming:
+            return response, None
+        if not parse_events:
+            await _drain(response.streaming_content)
+            return response, None
+        return response, await _collect_sse(response.streaming_content)
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_empty_message_returns_400(self, auth_async_client, workspace_from_membership):
-        """Empty message content should return 400."""
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps(
-                {
-                    "messages": [{"content": ""}],
-                    "data": {"workspaceId": str(workspace_from_membership.id)},
-                }
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == 400
-        body = json.loads(response.content)
-        assert "empty" in body["error"].lower()
+    return async_to_sync(post)()
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_whitespace_only_message_returns_400(
-        self, auth_async_client, workspace_from_membership
-    ):
-        """Whitespace-only message should return 400."""
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps(
-                {
-                    "messages": [{"content": "   \n\t  "}],
-                    "data": {"workspaceId": str(workspace_from_membership.id)},
-                }
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == 400
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_message_too_long_returns_400(self, auth_async_client, workspace_from_membership):
-        """Message exceeding MAX_MESSAGE_LENGTH should return 400."""
-        long_msg = "x" * 10_001
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps(_chat_body(workspace_from_membership.id, message=long_msg)),
-            content_type="application/json",
-        )
-        assert response.status_code == 400
-        body = json.loads(response.content)
-        assert "10000" in body["error"]
+# ---------------------------------------------------------------------------
+# Layer 1: Chat Endpoint Validation
+# ---------------------------------------------------------------------------
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_non_member_returns_403(self, auth_async_client):
-        """User without tenant membership should get 403."""
-        # No workspace membership — send a fake workspace ID
-        fake_workspace_id = str(uuid.uuid4())
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps(_chat_body(fake_workspace_id)),
-            content_type="application/json",
-        )
-        assert response.status_code == 403
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_nonexistent_tenant_id_returns_403(self, auth_async_client):
-        """Non-existent workspace ID should return 403."""
-        fake_id = str(uuid.uuid4())
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data=json.dumps(_chat_body(fake_id)),
-            content_type="application/json",
-        )
-        assert response.status_code == 403
+class TestChatEndpointValidation:
+    """Test request validation in the chat view."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_invalid_json_returns_400(self, auth_async_client):
-        """Invalid JSON body should return 400."""
-        response = await auth_async_client.post(
-            "/api/chat/",
-            data="not json",
-            content_type="application/json",
-        )
+    @pytest.mark.django_db
+    def test_rejected_requests(self, auth_async_client, chat_body):
+        """Anonymous, wrong-method and non-member requests are rejected.
+
+        The probes share no state, so they are sent concurrently in one test.
+        """
+        probes = {
+            "anonymous": (
+                AsyncClient().post("/api/chat/", data=chat_body, content_type="application/json"),
+                401,
+            ),
+            "get": (auth_async_client.get("/api/chat/"), 405),
+            "unknown_workspace": (
+                auth_async_client.post(
+                    "/api/chat/",
+                    data=orjson.dumps(_chat_body(uuid.uuid4())),
+                    content_type="application/json",
+                ),
+                403,
+            ),
+        }
+
+        async def send_probes():
+            return await asyncio.gather(*(probe for probe, _ in probes.values()))
+
+        responses = async_to_sync(send_probes)()
+
+        assert {name: r.status_code for name, r in zip(probes, responses, strict=True)} == {
+            name: status for name, (_, status) in probes.items()
+        }
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "make_payload,error",
+        [
+            (lambda ws: {"data": {"workspaceId": ws}}, "messages is required"),
+            (lambda ws: {"messages": [{"content": "hello"}]}, "workspaceId is required"),
+            (lambda ws: _chat_body(ws, message=""), "Empty message"),
+            (lambda ws: _chat_body(ws, message="   \n\t  "), "Empty message"),
+            (
+                lambda ws: _chat_body(ws, message="x" * 10_001),
+                "Message exceeds 10000 characters",
+            ),
+            (lambda ws: "not json", "Invalid JSON"),
+        ],
+        ids=[
+            "missing_messages",
+            "missing_workspace_id",
+            "empty",
+            "whitespace",
+            "too_long",
+            "bad_json",
+        ],
+    )
+    def test_invalid_request_returns_400(
+        self, auth_async_client, workspace_from_membership, make_payload, error
+    ):
+        """Malformed chat requests are rejected with a 400 and an explanatory error."""
+        payload = make_payload(str(workspace_from_membership.id))
+        response, _ = _post_chat(auth_async_client, payload)
         assert response.status_code == 400
+        assert orjson.loads(response.content) == {"error": error}
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_v6_parts_format_accepted(self, auth_async_client, workspace_from_membership):
+    @pytest.mark.django_db
+    def test_v6_parts_format_accepted(
+        self, auth_async_client, workspace_from_membership, chat_views
+    ):
         """AI SDK v6 parts format should be accepted."""
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
-
-            mock_cp.return_value = MemorySaver()
-
-            # Mock the agent to return a simple text response
-            mock_agent = AsyncMock()
 
-            async def fake_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": MagicMock(content="Hello!")},
-                }
+        # Mock the agent to return a simple text response
+        async def fake_events(*args, **kwargs):
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": _chunk(content="Hello!")},
+            }
 
-            mock_agent.astream_events = fake_events
-            mock_build.return_value = mock_agent
+        mock_agent = SimpleNamespace(astream_events=fake_events)
+        chat_views.build_agent_graph.return_value = mock_agent
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body_v6(workspace_from_membership.id)),
-                content_type="application/json",
-            )
-            assert response.status_code == 200
+        response, _ = _post_chat(
+            auth_async_client, _chat_body_v6(workspace_from_membership.id), parse_events=False
+        )
+        assert response.status_code == 200
 
 
 # ---------------------------------------------------------------------------
@@ -282,70 +312,42 @@ class TestChatEndpointValidation:
 class TestMCPToolLoading:
     """Test MCP tool loading in the chat view."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_mcp_tools_failure_returns_500(
-        self, auth_async_client, workspace_from_membership
-    ):
+    @pytest.mark.django_db
+    def test_mcp_tools_failure_returns_500(self, auth_async_client, chat_body, chat_views):
         """When get_mcp_tools() raises, chat view should return 500."""
-        with patch(
-            "apps.chat.views.get_mcp_tools",
-            new_callable=AsyncMock,
-            side_effect=ConnectionError("MCP server unreachable"),
-        ):
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
-            assert response.status_code == 500
-            body = json.loads(response.content)
-            assert "Agent initialization failed" in body["error"]
-            assert "Ref:" in body["error"]
-
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_mcp_tools_success_proceeds_to_agent(
-        self, auth_async_client, workspace_from_membership
-    ):
-        """When get_mcp_tools() succeeds, the agent should be built with those tools."""
-        mock_tool = MagicMock()
-        mock_tool.name = "query"
+        chat_views.get_mcp_tools.side_effect = ConnectionError("MCP server unreachable")
 
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = [mock_tool]
-            from langgraph.checkpoint.memory import MemorySaver
+        response, _ = _post_chat(auth_async_client, chat_body)
+        assert response.status_code == 500
+        body = orjson.loads(response.content)
+        assert "Agent initialization failed" in body["error"]
+        assert "Ref:" in body["error"]
 
-            mock_cp.return_value = MemorySaver()
+    @pytest.mark.django_db
+    def test_mcp_tools_success_proceeds_to_agent(self, auth_async_client, chat_body, chat_views):
+        """When get_mcp_tools() succeeds, the agent should be built with those tools."""
+        mock_tool = _StubTool("query")
 
-            mock_agent = AsyncMock()
+        chat_views.get_mcp_tools.return_value = [mock_tool]
 
-            async def fake_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": MagicMock(content="Hi")},
-                }
+        async def fake_events(*args, **kwargs):
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": _chunk(content="Hi")},
+            }
 
-            mock_agent.astream_events = fake_events
-            mock_build.return_value = mock_agent
+        mock_agent = SimpleNamespace(astream_events=fake_events)
+        chat_views.build_agent_graph.return_value = mock_agent
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
-            assert response.status_code == 200
+        response, _ = _post_chat(auth_async_client, chat_body, parse_events=False)
+        assert response.status_code == 200
 
-            # Verify MCP tools were passed to build_agent_graph
-            mock_build.assert_called_once()
-            call_kwargs = mock_build.call_args
-            assert call_kwargs.kwargs.get("mcp_tools") == [mock_tool] or (
-                len(call_kwargs.args) > 3 and call_kwargs.args[3] == [mock_tool]
-            )
+        # Verify MCP tools were passed to build_agent_graph
+        chat_views.build_agent_graph.assert_called_once()
+        call_kwargs = chat_views.build_agent_graph.call_args
+        assert call_kwargs.kwargs.get("mcp_tools") == [mock_tool] or (
+            len(call_kwargs.args) > 3 and call_kwargs.args[3] == [mock_tool]
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -354,14 +356,23 @@ class TestMCPToolLoading:
 
 
 class TestAgentGraphAssembly:
-    """Test that build_agent_graph correctly incorporates MCP tools."""
+    """Test that build_agent_graph correctly incorporates MCP tools.
+
+    Building the tool list only closes over the workspace and user, so these use
+    unsaved instances and run without a database.
+    """
+
+    @pytest.fixture
+    def user(self):
+        return get_user_model()(email="unsaved@example.com")
+
+    @pytest.fixture
+    def workspace(self):
+        return Workspace(name="Unsaved")
 
     def test_mcp_tools_included_in_tool_list(self, user, workspace):
         """MCP tools should be included alongside local tools."""
-        from apps.agents.graph.base import _build_tools
-
-        mock_mcp_tool = MagicMock()
-        mock_mcp_tool.name = "query"
+        mock_mcp_tool = _StubTool("query")
 
         tools = _build_tools(workspace, user, [mock_mcp_tool])
         tool_names = [t.name for t in tools]
@@ -374,8 +385,6 @@ class TestAgentGraphAssembly:
 
     def test_empty_mcp_tools_only_local(self, user, workspace):
         """With empty MCP tools, only local tools should be present."""
-        from apps.agents.graph.base import _build_tools
-
         tools = _build_tools(workspace, user, [])
         tool_names = [t.name for t in tools]
 
@@ -388,13 +397,9 @@ class TestAgentGraphAssembly:
 
     def test_multiple_mcp_tools_preserved(self, user, workspace):
         """Multiple MCP tools should all be included."""
-        from apps.agents.graph.base import _build_tools
-
-        mcp_tools = []
-        for name in ["query", "list_tables", "describe_table", "get_metadata"]:
-            t = MagicMock()
-            t.name = name
-            mcp_tools.append(t)
+        mcp_tools = [
+            _StubTool(name) for name in ["query", "list_tables", "describe_table", "get_metadata"]
+        ]
 
         tools = _build_tools(workspace, user, mcp_tools)
         tool_names = [t.name for t in tools]
@@ -412,27 +417,21 @@ class TestSSEStreamFormat:
     """Test the langgraph_to_ui_stream SSE output format."""
 
     @pytest.mark.asyncio
-    async def test_text_only_stream(self):
+    async def test_text_only_stream(self, sse_events):
         """Simple text response should produce correct SSE event sequence."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="Hello world")},
+                "data": {"chunk": _chunk(content="Hello world")},
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
         # Verify event sequence
-        types = [e["type"] for e in events]
         assert types[0] == "start"
         assert types[1] == "start-step"
         assert "text-start" in types
@@ -442,14 +441,11 @@ class TestSSEStreamFormat:
         assert types[-1] == "finish"
 
         # Verify text content
-        text_deltas = [e for e in events if e["type"] == "text-delta"]
-        assert len(text_deltas) > 0
-        assert text_deltas[0]["delta"] == "Hello world"
+        assert [e["delta"] for e in sse_events if e["type"] == "text-delta"] == ["Hello world"]
 
     @pytest.mark.asyncio
-    async def test_tool_call_stream(self):
+    async def test_tool_call_stream(self, sse_events):
         """Tool call should produce tool-input-available and tool-output-available events."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -466,34 +462,28 @@ class TestSSEStreamFormat:
             }
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="Found 1 result.")},
+                "data": {"chunk": _chunk(content="Found 1 result.")},
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
-        types = [e["type"] for e in events]
         assert "tool-input-available" in types
         assert "tool-output-available" in types
 
         # Verify tool event content
-        tool_input = next(e for e in events if e["type"] == "tool-input-available")
+        tool_input = next(e for e in sse_events if e["type"] == "tool-input-available")
         assert tool_input["toolName"] == "query"
         assert tool_input["toolCallId"] == "run-123"
 
-        tool_output = next(e for e in events if e["type"] == "tool-output-available")
+        tool_output = next(e for e in sse_events if e["type"] == "tool-output-available")
         assert tool_output["toolCallId"] == "run-123"
 
     @pytest.mark.asyncio
     async def test_tool_output_truncated_to_2000_chars(self):
         """Tool output longer than 2000 chars should be truncated."""
-        mock_agent = AsyncMock()
         long_output = "x" * 5000
 
         async def fake_events(*args, **kwargs):
@@ -510,24 +500,19 @@ class TestSSEStreamFormat:
                 },
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        raw = b"".join(
+            [chunk.encode() async for chunk in langgraph_to_ui_stream(mock_agent, {}, {})]
+        )
 
-        tool_output = next(e for e in events if e["type"] == "tool-output-available")
-        assert tool_output["output"].startswith("x" * 2000)
-        assert "truncated" in tool_output["output"]
-        assert "5000 chars total" in tool_output["output"]
+        # Checked on the encoded stream: exactly 2000 x's, then the JSON-escaped notice.
+        truncated = b"x" * 2000 + rb"\n\n... (truncated, 5000 chars total)"
+        assert b'"output": "' + truncated + b'"' in raw
 
     @pytest.mark.asyncio
-    async def test_duplicate_tool_events_deduplicated(self):
+    async def test_duplicate_tool_events_deduplicated(self, sse_events):
         """Duplicate run_id tool events should be filtered."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             for _ in range(3):
@@ -544,44 +529,35 @@ class TestSSEStreamFormat:
                     },
                 }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
-        tool_events = [e for e in events if e["type"] == "tool-input-available"]
-        assert len(tool_events) == 1
+        assert types.count("tool-input-available") == 1
 
     @pytest.mark.asyncio
-    async def test_error_during_streaming_handled(self):
+    async def test_error_during_streaming_handled(self, sse_events):
         """Errors during streaming should produce error text and clean finish."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="Starting...")},
+                "data": {"chunk": _chunk(content="Starting...")},
             }
             raise RuntimeError("LLM connection lost")
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
 
-        types = [e["type"] for e in events]
+        types = [e["type"] for e in sse_events]
 
         # Should have error message
         error_deltas = [
-            e for e in events if e["type"] == "text-delta" and "error" in e.get("delta", "").lower()
+            e
+            for e in sse_events
+            if e["type"] == "text-delta" and "error" in e.get("delta", "").lower()
         ]
         assert len(error_deltas) > 0
 
@@ -590,15 +566,14 @@ class TestSSEStreamFormat:
         assert types[-1] == "finish"
 
     @pytest.mark.asyncio
-    async def test_reasoning_blocks_emitted(self):
+    async def test_reasoning_blocks_emitted(self, sse_events):
         """Thinking/reasoning blocks should produce reasoning events."""
-        mock_agent = AsyncMock()
-
-        chunk_with_thinking = MagicMock()
-        chunk_with_thinking.content = [
-            {"type": "thinking", "thinking": "Let me analyze this..."},
-            {"type": "text", "text": "Here is my answer."},
-        ]
+        chunk_with_thinking = _chunk(
+            content=[
+                {"type": "thinking", "thinking": "Let me analyze this..."},
+                {"type": "text", "text": "Here is my answer."},
+            ]
+        )
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -606,16 +581,11 @@ class TestSSEStreamFormat:
                 "data": {"chunk": chunk_with_thinking},
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
-        types = [e["type"] for e in events]
         assert "reasoning-start" in types
         assert "reasoning-delta" in types
         assert "reasoning-end" in types
@@ -623,37 +593,31 @@ class TestSSEStreamFormat:
         assert "text-delta" in types
 
     @pytest.mark.asyncio
-    async def test_empty_content_chunks_skipped(self):
+    async def test_empty_content_chunks_skipped(self, sse_events):
         """Chunks with no content should be skipped."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             # Empty content chunk
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="")},
+                "data": {"chunk": _chunk(content="")},
             }
             # None content
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content=None)},
+                "data": {"chunk": _chunk(content=None)},
             }
             # Actual content
             yield {
                 "event": "on_chat_model_stream",
-                "data": {"chunk": MagicMock(content="Real content")},
+                "data": {"chunk": _chunk(content="Real content")},
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
 
-        text_deltas = [e for e in events if e["type"] == "text-delta"]
+        text_deltas = [e for e in sse_events if e["type"] == "text-delta"]
         assert len(text_deltas) == 1
         assert text_deltas[0]["delta"] == "Real content"
 
@@ -685,233 +649,146 @@ class TestSSEStreamFormat:
 class TestEndToEndStreaming:
     """Test the full chat view → SSE streaming path."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_full_text_response_stream(self, auth_async_client, workspace_from_membership):
+    @pytest.mark.django_db
+    def test_full_text_response_stream(self, auth_async_client, chat_body, chat_views):
         """Full path: chat request → text SSE stream."""
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
-
-            mock_cp.return_value = MemorySaver()
 
-            mock_agent = AsyncMock()
-
-            async def fake_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": MagicMock(content="There are 5 tables available.")},
-                }
+        async def fake_events(*args, **kwargs):
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": _chunk(content="There are 5 tables available.")},
+            }
 
-            mock_agent.astream_events = fake_events
-            mock_build.return_value = mock_agent
+        mock_agent = SimpleNamespace(astream_events=fake_events)
+        chat_views.build_agent_graph.return_value = mock_agent
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
+        response, events = _post_chat(auth_async_client, chat_body)
 
-            assert response.status_code == 200
-            assert response["Content-Type"] == "text/event-stream; charset=utf-8"
-            assert response["Cache-Control"] == "no-cache"
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream; charset=utf-8"
+        assert response["Cache-Control"] == "no-cache"
 
-            events = await _collect_sse_events(response)
-            types = [e["type"] for e in events]
+        types = [e["type"] for e in events]
 
-            assert types[0] == "start"
-            assert "text-delta" in types
-            assert types[-1] == "finish"
+        assert types[0] == "start"
+        assert "text-delta" in types
+        assert types[-1] == "finish"
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_full_tool_call_stream(self, auth_async_client, workspace_from_membership):
+    @pytest.mark.django_db
+    def test_full_tool_call_stream(self, auth_async_client, chat_body, chat_views):
         """Full path: chat request → tool call → tool result → text → SSE stream."""
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
 
-            mock_cp.return_value = MemorySaver()
-
-            mock_agent = AsyncMock()
-
-            async def fake_events(*args, **kwargs):
-                # Tool call
-                yield {
-                    "event": "on_tool_end",
-                    "run_id": "run-abc",
-                    "name": "list_tables",
-                    "data": {
-                        "output": ToolMessage(
-                            content=json.dumps(
-                                {
-                                    "success": True,
-                                    "data": {"tables": [{"name": "users", "type": "table"}]},
-                                }
-                            ),
-                            tool_call_id="call-abc",
-                            name="list_tables",
+        async def fake_events(*args, **kwargs):
+            # Tool call
+            yield {
+                "event": "on_tool_end",
+                "run_id": "run-abc",
+                "name": "list_tables",
+                "data": {
+                    "output": ToolMessage(
+                        content=json.dumps(
+                            {
+                                "success": True,
+                                "data": {"tables": [{"name": "users", "type": "table"}]},
+                            }
                         ),
-                    },
-                }
-                # Text response
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": MagicMock(content="Found the users table.")},
-                }
+                        tool_call_id="call-abc",
+                        name="list_tables",
+                    ),
+                },
+            }
+            # Text response
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": _chunk(content="Found the users table.")},
+            }
 
-            mock_agent.astream_events = fake_events
-            mock_build.return_value = mock_agent
+        mock_agent = SimpleNamespace(astream_events=fake_events)
+        chat_views.build_agent_graph.return_value = mock_agent
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
+        response, events = _post_chat(auth_async_client, chat_body)
 
-            assert response.status_code == 200
-            events = await _collect_sse_events(response)
-            types = [e["type"] for e in events]
+        assert response.status_code == 200
+        types = [e["type"] for e in events]
 
-            assert "tool-input-available" in types
-            assert "tool-output-available" in types
-            assert "text-delta" in types
+        assert "tool-input-available" in types
+        assert "tool-output-available" in types
+        assert "text-delta" in types
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_thread_created_on_chat(
-        self, auth_async_client, tenant_membership, workspace_from_membership
+    @pytest.mark.django_db
+    def test_thread_created_on_chat(
+        self, auth_async_client, tenant_membership, workspace_from_membership, chat_views
     ):
         """A Thread record should be created when chatting."""
-        from apps.chat.models import Thread
-
         thread_id = str(uuid.uuid4())
 
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
-
-            mock_cp.return_value = MemorySaver()
-
-            mock_agent = AsyncMock()
-
-            async def fake_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": MagicMock(content="Hello")},
-                }
-
-            mock_agent.astream_events = fake_events
-            mock_build.return_value = mock_agent
+        async def fake_events(*args, **kwargs):
+            yield {
+                "event": "on_chat_model_stream",
+                "data": {"chunk": _chunk(content="Hello")},
+            }
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id, thread_id=thread_id)),
-                content_type="application/json",
-            )
+        mock_agent = SimpleNamespace(astream_events=fake_events)
+        chat_views.build_agent_graph.return_value = mock_agent
 
-            assert response.status_code == 200
+        response, _ = _post_chat(
+            auth_async_client,
+            _chat_body(workspace_from_membership.id, thread_id=thread_id),
+            parse_events=False,
+        )
 
-            # Consume the stream to ensure the view fully executes
-            await _collect_sse_events(response)
+        assert response.status_code == 200
 
-            # Verify thread was created and scoped to the workspace
-            thread = await Thread.objects.filter(id=thread_id).afirst()
-            assert thread is not None
-            assert str(thread.workspace_id) == str(workspace_from_membership.id)
+        # Verify thread was created and scoped to the workspace
+        thread = Thread.objects.filter(id=thread_id).first()
+        assert thread is not None
+        assert str(thread.workspace_id) == str(workspace_from_membership.id)
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_agent_build_failure_returns_500(
-        self, auth_async_client, workspace_from_membership
-    ):
+    @pytest.mark.django_db
+    def test_agent_build_failure_returns_500(self, auth_async_client, chat_body, chat_views):
         """If agent build fails, should return 500."""
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
-
-            mock_cp.return_value = MemorySaver()
-            mock_build.side_effect = RuntimeError("Agent build failed")
-
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
-            assert response.status_code == 500
-            body = json.loads(response.content)
-            assert "Agent initialization failed" in body["error"]
+        chat_views.build_agent_graph.side_effect = RuntimeError("Agent build failed")
 
-    @pytest.mark.asyncio
-    @pytest.mark.django_db(transaction=True)
-    async def test_checkpointer_retry_on_failure(
-        self, auth_async_client, workspace_from_membership
-    ):
+        response, _ = _post_chat(auth_async_client, chat_body)
+        assert response.status_code == 500
+        body = orjson.loads(response.content)
+        assert "Agent initialization failed" in body["error"]
+
+    @pytest.mark.django_db
+    def test_checkpointer_retry_on_failure(self, auth_async_client, chat_body, chat_views):
         """If first checkpointer fails, should retry with force_new=True."""
         call_count = 0
 
-        with (
-            patch("apps.chat.views.get_mcp_tools", new_callable=AsyncMock) as mock_mcp,
-            patch("apps.chat.views.ensure_checkpointer", new_callable=AsyncMock) as mock_cp,
-            patch("apps.chat.views.build_agent_graph") as mock_build,
-        ):
-            mock_mcp.return_value = []
-            from langgraph.checkpoint.memory import MemorySaver
-
-            mock_cp.return_value = MemorySaver()
-
-            def build_side_effect(*args, **kwargs):
-                nonlocal call_count
-                call_count += 1
-                if call_count == 1:
-                    raise ConnectionError("Stale checkpointer connection")
-                # Second call succeeds
-                mock_agent = AsyncMock()
+        def build_side_effect(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise ConnectionError("Stale checkpointer connection")
 
-                async def fake_events(*a, **kw):
-                    yield {
-                        "event": "on_chat_model_stream",
-                        "data": {"chunk": MagicMock(content="Recovered!")},
-                    }
+            # Second call succeeds
+            async def fake_events(*a, **kw):
+                yield {
+                    "event": "on_chat_model_stream",
+                    "data": {"chunk": _chunk(content="Recovered!")},
+                }
 
-                mock_agent.astream_events = fake_events
-                return mock_agent
+            mock_agent = SimpleNamespace(astream_events=fake_events)
+            return mock_agent
 
-            mock_build.side_effect = build_side_effect
+        chat_views.build_agent_graph.side_effect = build_side_effect
 
-            response = await auth_async_client.post(
-                "/api/chat/",
-                data=json.dumps(_chat_body(workspace_from_membership.id)),
-                content_type="application/json",
-            )
+        response, _ = _post_chat(auth_async_client, chat_body, parse_events=False)
 
-            assert response.status_code == 200
-            assert call_count == 2  # First failed, second succeeded
+        assert response.status_code == 200
+        assert call_count == 2  # First failed, second succeeded
 
 
 class TestProgressStream:
     """Tests for progress queue integration in langgraph_to_ui_stream."""
 
     @pytest.mark.asyncio
-    async def test_run_materialization_card_opens_on_tool_start(self):
+    async def test_run_materialization_card_opens_on_tool_start(self, sse_events):
         """on_tool_start for run_materialization should emit tool-input-available immediately."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -933,16 +810,11 @@ class TestProgressStream:
                 },
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
-        types = [e["type"] for e in events]
         # tool-input-available must appear (opened on tool_start)
         assert "tool-input-available" in types
         # tool-output-available must appear (final result on tool_end)
@@ -951,13 +823,9 @@ class TestProgressStream:
         assert types.count("tool-input-available") == 1
 
     @pytest.mark.asyncio
-    async def test_progress_queue_items_emitted_as_tool_output(self):
+    async def test_progress_queue_items_emitted_as_tool_output(self, sse_events):
         """Progress queue items should be emitted as tool-output-available with progress text."""
-        import asyncio as _asyncio
-
-        mock_agent = AsyncMock()
-
-        progress_queue = _asyncio.Queue()
+        progress_queue = asyncio.Queue()
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -982,18 +850,11 @@ class TestProgressStream:
                 },
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(
-            mock_agent, {}, {}, progress_queue=progress_queue
-        ):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}, progress_queue=progress_queue))
 
-        tool_outputs = [e for e in events if e["type"] == "tool-output-available"]
+        tool_outputs = [e for e in sse_events if e["type"] == "tool-output-available"]
         # At least the two progress updates + the final result
         assert len(tool_outputs) >= 3
         # Progress text contains the message
@@ -1004,13 +865,9 @@ class TestProgressStream:
         assert len(call_ids) == 1
 
     @pytest.mark.asyncio
-    async def test_final_result_replaces_progress(self):
+    async def test_final_result_replaces_progress(self, sse_events):
         """The on_tool_end result is the last tool-output-available."""
-        import asyncio as _asyncio
-
-        mock_agent = AsyncMock()
-
-        progress_queue = _asyncio.Queue()
+        progress_queue = asyncio.Queue()
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -1033,25 +890,17 @@ class TestProgressStream:
                 },
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(
-            mock_agent, {}, {}, progress_queue=progress_queue
-        ):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}, progress_queue=progress_queue))
 
-        tool_outputs = [e for e in events if e["type"] == "tool-output-available"]
+        tool_outputs = [e for e in sse_events if e["type"] == "tool-output-available"]
         # Last output is the final result (contains rows_loaded)
         assert "rows_loaded" in tool_outputs[-1].get("output", "")
 
     @pytest.mark.asyncio
-    async def test_non_materialization_tool_unaffected(self):
+    async def test_non_materialization_tool_unaffected(self, sse_events):
         """Other tools still use the on_tool_end-only path."""
-        mock_agent = AsyncMock()
 
         async def fake_events(*args, **kwargs):
             yield {
@@ -1067,16 +916,11 @@ class TestProgressStream:
                 },
             }
 
-        mock_agent.astream_events = fake_events
+        mock_agent = SimpleNamespace(astream_events=fake_events)
 
-        events = []
-        async for chunk in langgraph_to_ui_stream(mock_agent, {}, {}):
-            for line in chunk.strip().split("\n"):
-                line = line.strip()
-                if line.startswith("data: "):
-                    events.append(json.loads(line[6:]))
+        await _drain(langgraph_to_ui_stream(mock_agent, {}, {}))
+        types = [e["type"] for e in sse_events]
 
-        types = [e["type"] for e in events]
         assert "tool-input-available" in types
         assert "tool-output-available" in types
         assert types.count("tool-input-available") == 1
@@ -5,7 +5,7 @@ Tests the full tool handler → service → response envelope chain.
 Database access is mocked at the Django ORM / psycopg boundary.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -25,24 +25,39 @@ from mcp_server.services.query import execute_query
 # --- Fixtures ---
 
 
-@pytest.fixture
+CONNECTION_PARAMS = {
+    "host": "localhost",
+    "port": 5432,
+    "dbname": "testdb",
+    "user": "testuser",
+    "password": "testpass",
+}
+
+
+@pytest.fixture(scope="module")
 def project_context():
-    """A QueryContext that doesn't require DB access."""
+    """A QueryContext that doesn't require DB access.
+
+    QueryContext is frozen and the query service only reads it, so one instance
+    serves the whole module.
+    """
     return QueryContext(
         tenant_id="test-tenant",
         schema_name="public",
         max_rows_per_query=500,
         max_query_timeout_seconds=30,
-        connection_params={
-            "host": "localhost",
-            "port": 5432,
-            "dbname": "testdb",
-            "user": "testuser",
-            "password": "testpass",
-        },
+        connection_params=CONNECTION_PARAMS,
     )
 
 
+@pytest.fixture
+def mock_exec(monkeypatch):
+    """Stub for the query service's database round trip."""
+    stub = AsyncMock()
+    monkeypatch.setattr("mcp_server.services.query._execute_async", stub)
+    return stub
+
+
 # --- Envelope tests ---
 
 
@@ -127,7 +142,6 @@ class TestExecuteQuery:
         assert "not allowed" in result["error"]["message"].lower()
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_successful_query(self, mock_exec, project_context):
         mock_exec.return_value = {
             "columns": ["id", "name"],
@@ -145,7 +159,6 @@ class TestExecuteQuery:
         assert "users" in result["tables_accessed"]
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_truncation_detected(self, mock_exec, project_context):
         """When row_count equals max_limit, truncated should be True."""
         mock_exec.return_value = {
@@ -157,7 +170,6 @@ class TestExecuteQuery:
         assert result["truncated"] is True
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_limit_injected(self, mock_exec, project_context):
         mock_exec.return_value = {
             "columns": ["id"],
@@ -168,7 +180,6 @@ class TestExecuteQuery:
         assert "LIMIT" in result["sql_executed"].upper()
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_timeout_error(self, mock_exec, project_context):
         import psycopg.errors
 
@@ -178,7 +189,6 @@ class TestExecuteQuery:
         assert result["error"]["code"] == QUERY_TIMEOUT
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_connection_error(self, mock_exec, project_context):
         import psycopg
 
@@ -188,7 +198,6 @@ class TestExecuteQuery:
         assert result["error"]["code"] == CONNECTION_ERROR
 
     @pytest.mark.asyncio
-    @patch("mcp_server.services.query._execute_async")
     async def test_unexpected_error(self, mock_exec, project_context):
         mock_exec.side_effect = RuntimeError("boom")
         result = await execute_query(project_context, "SELECT * FROM users")
@@ -264,6 +264,65 @@ class TestPipelineDescribeTable:
         assert result["columns"][0]["description"] == ""
 
 
+class TestPipelineDescribeTables:
+    def _make_ctx(self, schema_name="test_schema"):
+        from mcp_server.context import QueryContext
+
+        return QueryContext(
+            tenant_id="test-domain",
+            schema_name=schema_name,
+            max_rows_per_query=500,
+            max_query_timeout_seconds=30,
+            connection_params={},
+        )
+
+    @pytest.mark.asyncio
+    async def test_groups_columns_from_single_query(self):
+        from mcp_server.services.metadata import pipeline_describe_tables
+
+        ctx = self._make_ctx()
+        pipeline_config = _make_pipeline_config(sources=[("cases", "Cases"), ("forms", "Forms")])
+        execute = AsyncMock(
+            return_value={
+                "columns": [
+                    "table_name",
+                    "column_name",
+                    "data_type",
+                    "is_nullable",
+                    "column_default",
+                ],
+                "rows": [
+                    ["raw_cases", "case_id", "text", "NO", None],
+                    ["raw_cases", "closed", "boolean", "YES", None],
+                    ["raw_forms", "form_id", "text", "NO", None],
+                ],
+                "row_count": 3,
+            }
+        )
+
+        with patch("mcp_server.services.metadata._execute_async_parameterized", new=execute):
+            result = await pipeline_describe_tables(
+                ["raw_cases", "raw_forms", "missing"], ctx, None, pipeline_config
+            )
+
+        assert execute.await_count == 1
+        assert execute.await_args.args[2] == ("test_schema", ["raw_cases", "raw_forms", "missing"])
+        assert set(result) == {"raw_cases", "raw_forms"}
+        assert [c["name"] for c in result["raw_cases"]["columns"]] == ["case_id", "closed"]
+        assert result["raw_forms"]["description"] == "Forms"
+
+    @pytest.mark.asyncio
+    async def test_skips_query_for_empty_table_list(self):
+        from mcp_server.services.metadata import pipeline_describe_tables
+
+        execute = AsyncMock()
+        with patch("mcp_server.services.metadata._execute_async_parameterized", new=execute):
+            result = await pipeline_describe_tables([], self._make_ctx(), None, MagicMock())
+
+        assert result == {}
+        execute.assert_not_awaited()
+
+
 class TestPipelineGetMetadata:
     def _make_ctx(self, schema_name="test_schema"):
         from mcp_server.context import QueryContext
@@ -323,7 +382,7 @@ class TestPipelineGetMetadata:
                 "mcp_server.services.metadata._execute_async_parameterized",
                 new=AsyncMock(
                     return_value={
-                        "rows": [["case_id", "text", "NO", None]],
+                        "rows": [["raw_cases", "case_id", "text", "NO", None]],
                         "row_count": 1,
                     }
                 ),
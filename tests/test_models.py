@@ -2,6 +2,7 @@
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 
 from apps.knowledge.models import (
     AgentLearning,
@@ -91,33 +92,28 @@ class TestKnowledgeModels:
 
 @pytest.mark.django_db
 class TestTenantMetadata:
-    def test_create_and_retrieve_metadata(self, tenant_membership):
+    def test_metadata_contract(self, tenant_membership, other_user, tenant):
         from django.utils import timezone
 
+        from apps.users.models import TenantMembership
         from apps.workspaces.models import TenantMetadata
 
         payload = {
             "case_types": ["patient", "household"],
             "app_definitions": [{"id": "abc", "name": "CHW App"}],
         }
+        other_membership = TenantMembership.objects.create(user=other_user, tenant=tenant)
         meta = TenantMetadata.objects.create(
             tenant_membership=tenant_membership,
             metadata=payload,
             discovered_at=timezone.now(),
         )
+        empty = TenantMetadata.objects.create(tenant_membership=other_membership)
+
         retrieved = TenantMetadata.objects.get(pk=meta.pk)
         assert retrieved.metadata["case_types"] == ["patient", "household"]
         assert retrieved.metadata["app_definitions"][0]["id"] == "abc"
+        assert TenantMetadata.objects.get(pk=empty.pk).metadata == {}
 
-    def test_one_to_one_with_tenant_membership(self, tenant_membership):
-        from apps.workspaces.models import TenantMetadata
-
-        TenantMetadata.objects.create(tenant_membership=tenant_membership)
-        with pytest.raises(Exception, match="unique constraint"):  # noqa: B017
+        with transaction.atomic(), pytest.raises(IntegrityError, match="unique constraint"):
             TenantMetadata.objects.create(tenant_membership=tenant_membership)
-
-    def test_metadata_defaults_to_empty_dict(self, tenant_membership):
-        from apps.workspaces.models import TenantMetadata
-
-        meta = TenantMetadata.objects.create(tenant_membership=tenant_membership)
-        assert meta.metadata == {}
@@ -59,15 +59,10 @@ def test_refresh_dispatches_celery_task(manage_client, workspace, tenant_members
 
 
 @pytest.mark.django_db
-def test_read_only_user_cannot_trigger_refresh(api_client, read_user, workspace):
-    api_client.force_authenticate(user=read_user)
-    resp = api_client.post(f"/api/workspaces/{workspace.id}/refresh/")
-    assert resp.status_code == 403
-
-
-@pytest.mark.django_db
-def test_non_member_cannot_trigger_refresh(api_client, other_user, workspace):
-    api_client.force_authenticate(user=other_user)
+@pytest.mark.parametrize("user_fixture", ["read_user", "other_user", None])
+def test_cannot_trigger_refresh(request, api_client, workspace, user_fixture):
+    if user_fixture:
+        api_client.force_authenticate(user=request.getfixturevalue(user_fixture))
     resp = api_client.post(f"/api/workspaces/{workspace.id}/refresh/")
     assert resp.status_code == 403
 
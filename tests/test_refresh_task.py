@@ -71,7 +71,7 @@ def test_refresh_task_marks_schema_active_on_success(provisioning_schema, tenant
 
         result = refresh_tenant_schema(str(provisioning_schema.id), str(tenant_membership_obj.id))
 
-    provisioning_schema.refresh_from_db()
+    provisioning_schema.refresh_from_db(fields=["state"])
     assert provisioning_schema.state == SchemaState.ACTIVE
     assert result["status"] == "active"
 
@@ -101,7 +101,7 @@ def test_refresh_task_schedules_old_schema_teardown(
 
         refresh_tenant_schema(str(provisioning_schema.id), str(tenant_membership_obj.id))
 
-    old_active_schema.refresh_from_db()
+    old_active_schema.refresh_from_db(fields=["state"])
     assert old_active_schema.state == SchemaState.TEARDOWN
     mock_apply_async.assert_called_once_with((str(old_active_schema.id),), countdown=30 * 60)
 
@@ -118,7 +118,7 @@ def test_refresh_task_marks_failed_on_schema_creation_error(
 
         result = refresh_tenant_schema(str(provisioning_schema.id), str(tenant_membership_obj.id))
 
-    provisioning_schema.refresh_from_db()
+    provisioning_schema.refresh_from_db(fields=["state"])
     assert provisioning_schema.state == SchemaState.FAILED
     assert "error" in result
 
@@ -137,7 +137,7 @@ def test_refresh_task_marks_failed_on_no_credential(provisioning_schema, tenant_
 
         result = refresh_tenant_schema(str(provisioning_schema.id), str(tenant_membership_obj.id))
 
-    provisioning_schema.refresh_from_db()
+    provisioning_schema.refresh_from_db(fields=["state"])
     assert provisioning_schema.state == SchemaState.FAILED
     assert "error" in result
 
@@ -169,7 +169,7 @@ def test_refresh_task_marks_failed_on_materialization_error(
 
         result = refresh_tenant_schema(str(provisioning_schema.id), str(tenant_membership_obj.id))
 
-    provisioning_schema.refresh_from_db()
+    provisioning_schema.refresh_from_db(fields=["state"])
     assert provisioning_schema.state == SchemaState.FAILED
     assert "error" in result
 
@@ -320,6 +320,13 @@ class TestDangerousFunctions:
         with pytest.raises(SQLValidationError):
             validator.validate("COPY users FROM '/tmp/data.csv'")
 
+    def test_reject_mixed_case_function_in_subquery(self):
+        """Raw function calls are matched case-insensitively wherever they appear."""
+        validator = SQLValidator(schema="public")
+
+        with pytest.raises(SQLValidationError, match="(?i)'pg_read_file' is not allowed"):
+            validator.validate("SELECT id FROM (SELECT PG_Read_File('/etc/passwd') AS id) AS t")
+
     def test_allow_safe_functions(self):
         """Test that safe functions are allowed."""
         validator = SQLValidator(schema="public")
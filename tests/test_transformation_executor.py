@@ -36,33 +36,29 @@ def _dbt_test_success():
 @pytest.fixture
 def system_assets(tenant):
     """Create 3 system-scoped assets."""
-    assets = []
-    for i in range(3):
-        assets.append(
-            TransformationAsset.objects.create(
-                name=f"stg_model_{i}",
-                scope=TransformationScope.SYSTEM,
-                tenant=tenant,
-                sql_content=f"SELECT * FROM raw_table_{i}",
-            )
+    return [
+        TransformationAsset.objects.create(
+            name=f"stg_model_{i}",
+            scope=TransformationScope.SYSTEM,
+            tenant=tenant,
+            sql_content=f"SELECT * FROM raw_table_{i}",
         )
-    return assets
+        for i in range(3)
+    ]
 
 
 @pytest.fixture
 def tenant_assets(tenant):
     """Create 2 tenant-scoped assets."""
-    assets = []
-    for i in range(2):
-        assets.append(
-            TransformationAsset.objects.create(
-                name=f"tenant_model_{i}",
-                scope=TransformationScope.TENANT,
-                tenant=tenant,
-                sql_content=f"SELECT * FROM stg_model_{i}",
-            )
+    return [
+        TransformationAsset.objects.create(
+            name=f"tenant_model_{i}",
+            scope=TransformationScope.TENANT,
+            tenant=tenant,
+            sql_content=f"SELECT * FROM stg_model_{i}",
         )
-    return assets
+        for i in range(2)
+    ]
 
 
 @pytest.fixture
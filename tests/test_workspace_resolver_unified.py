@@ -1,6 +1,7 @@
 """Tests for unified workspace resolution functions."""
 
 import uuid
+from types import SimpleNamespace
 
 import pytest
 from asgiref.sync import sync_to_async
@@ -33,6 +34,28 @@ class TestResolveWorkspaceRaw:
         assert err.status_code == 403
 
 
+@pytest.mark.django_db
+class TestResolveWorkspaceDrf:
+    """Tests for DRF workspace resolution."""
+
+    def test_loads_data_dictionary_by_default(self, user, workspace):
+        from apps.workspaces.workspace_resolver import resolve_workspace_drf
+
+        ws, membership, err = resolve_workspace_drf(SimpleNamespace(user=user), workspace.id)
+        assert err is None
+        assert membership.user_id == user.id
+        assert "data_dictionary" not in ws.get_deferred_fields()
+
+    def test_defers_data_dictionary_on_request(self, user, workspace):
+        from apps.workspaces.workspace_resolver import resolve_workspace_drf
+
+        ws, _, err = resolve_workspace_drf(
+            SimpleNamespace(user=user), workspace.id, defer_data_dictionary=True
+        )
+        assert err is None
+        assert ws.get_deferred_fields() == {"data_dictionary"}
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db
 class TestAresolveWorkspace: